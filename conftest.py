@@ -1,15 +1,15 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
-import pickle
-import shutil
 import tempfile
-from collections.abc import Generator
-from copy import deepcopy
+import threading
+import time
+from collections.abc import Generator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from shutil import rmtree
 from typing import TYPE_CHECKING, Any
 
 import filelock
@@ -29,10 +29,8 @@ from ocp_resources.secret import Secret
 from ocp_resources.storage_class import StorageClass
 from ocp_resources.storage_profile import StorageProfile
 from ocp_resources.subscription import Subscription
-from ocp_resources.virtual_machine import VirtualMachine
 from pytest_harvest import get_fixture_store
 from pytest_testconfig import config as py_config
-from timeout_sampler import TimeoutSampler
 
 from exceptions.exceptions import (
     ForkliftPodsNotRunningError,
@@ -50,42 +48,71 @@ from libs.forklift_inventory import (
     VsphereForkliftInventory,
 )
 from libs.providers.openshift import OCPProvider
-from utilities.constants import MTV_OPERATOR_NAME
+from utilities.constants import FORKLIFT_PODS_LABEL_SELECTOR, MTV_OPERATOR_NAME, MULTUS_CNI_CONFIG
 from utilities.hooks import create_hook_if_configured
 from utilities.logger import separator, setup_logging
-from utilities.mtv_migration import get_vm_suffix
+from utilities.mtv_migration import get_vm_suffix, prepare_source_vms
 from utilities.must_gather import run_must_gather
 from utilities.naming import generate_name_with_uuid
 from utilities.pytest_utils import (
     collect_created_resources,
+    dump_xdist_worker_results,
     enrich_junit_xml,
+    fast_rmtree,
     is_dry_run,
+    load_xdist_worker_results,
     prepare_base_path,
+    reset_xdist_results_dir,
     session_teardown,
     setup_ai_analysis,
 )
-from utilities.resources import create_and_store_resource, get_or_create_namespace
+from utilities.resources import create_and_store_resource, get_or_create_namespace, wait_for_condition_watch
 from utilities.ssh_utils import SSHConnectionManager
 from utilities.utils import (
     create_source_cnv_vms,
     create_source_provider,
+    delete_vm_if_exists,
     extract_vm_from_plan,
     generate_class_hash_prefix,
     get_cluster_client,
-    get_cluster_version,
     get_cluster_version_str,
     get_value_from_py_config,
     load_source_providers,
     resolve_providers_json_path,
 )
 from utilities.virtctl import add_to_path, download_virtctl_from_cluster
-from utilities.vmware_guest_operations import detect_vmware_ip_origins_via_guest_ops
 from utilities.worker_node_selection import get_worker_nodes, select_node_by_available_memory
 
 RESULTS_PATH = Path("./.xdist_results/")
-RESULTS_PATH.mkdir(exist_ok=True)
 LOGGER = logging.getLogger(__name__)
 BASIC_LOGGER = logging.getLogger("basic")
+LOG_LEVEL_NAMES = logging.getLevelNamesMapping()
+# must-gather runs in the background on test failures. Futures are keyed by the failing test's class (or module)
+# node id, then by test name: the class's last test joins them before the class fixtures are torn down,
+# pytest_sessionfinish joins all
+MUST_GATHER_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="must-gather")
+MUST_GATHER_FUTURES: dict[str, dict[str, Future[None]]] = {}
+FORKLIFT_INVENTORY_BY_PROVIDER_TYPE: dict[str, type[ForkliftInventory]] = {
+    Provider.ProviderType.OVA: OvaForkliftInventory,
+    Provider.ProviderType.RHV: OvirtForkliftInventory,
+    Provider.ProviderType.VSPHERE: VsphereForkliftInventory,
+    Provider.ProviderType.OPENSHIFT: OpenshiftForkliftInventory,
+    Provider.ProviderType.OPENSTACK: OpenstackForliftinventory,
+}
+# the phase banners are the same for every test
+SETUP_SEPARATOR = separator(symbol_="-", val="SETUP")
+CALL_SEPARATOR = separator(symbol_="-", val="CALL")
+TEARDOWN_SEPARATOR = separator(symbol_="-", val="TEARDOWN")
+# (report outcome, report phase) -> status line, phases without an entry are not logged
+TEST_STATUS_FORMATS: dict[tuple[str, str], str] = {
+    ("passed", "call"): "\nTEST: {test_name} STATUS: \033[0;32mPASSED\033[0m",
+    ("skipped", "setup"): "\nTEST: {test_name} STATUS: \033[1;33mSKIPPED\033[0m",
+    ("skipped", "call"): "\nTEST: {test_name} STATUS: \033[1;33mSKIPPED\033[0m",
+    ("skipped", "teardown"): "\nTEST: {test_name} STATUS: \033[1;33mSKIPPED\033[0m",
+    ("failed", "setup"): "\nTEST: {test_name} [setup] STATUS: \033[0;31mERROR\033[0m",
+    ("failed", "call"): "\nTEST: {test_name} STATUS: \033[0;31mFAILED\033[0m",
+    ("failed", "teardown"): "\nTEST: {test_name} [teardown] STATUS: \033[0;31mERROR\033[0m",
+}
 
 
 # Pytest start
@@ -157,13 +184,12 @@ def pytest_sessionstart(session):
         prepare_base_path(base_path=_data_collector_path)
 
     tests_log_file = session.config.getoption("log_file") or "pytest-tests.log"
-    if os.path.exists(tests_log_file):
-        Path(tests_log_file).unlink(missing_ok=True)
+    Path(tests_log_file).unlink(missing_ok=True)
 
     _log_level: int | str = session.config.getoption("log_cli_level") or logging.INFO
 
     if isinstance(_log_level, str):
-        _log_level = logging.getLevelNamesMapping()[_log_level]
+        _log_level = LOG_LEVEL_NAMES[_log_level]
 
     if session.config.getoption("openshift_python_wrapper_log_debug"):
         os.environ["OPENSHIFT_PYTHON_WRAPPER_LOG_LEVEL"] = "DEBUG"
@@ -189,34 +215,27 @@ def pytest_runtest_setup(item):
             pytest.xfail(f"previous test failed ({previousfailed.name})")
 
     BASIC_LOGGER.info(f"\n{separator(symbol_='-', val=item.name)}")
-    BASIC_LOGGER.info(f"{separator(symbol_='-', val='SETUP')}")
+    BASIC_LOGGER.info(SETUP_SEPARATOR)
 
 
 def pytest_runtest_call(item):
-    BASIC_LOGGER.info(f"{separator(symbol_='-', val='CALL')}")
+    BASIC_LOGGER.info(CALL_SEPARATOR)
 
 
-def pytest_runtest_teardown(item):
-    BASIC_LOGGER.info(f"{separator(symbol_='-', val='TEARDOWN')}")
-
-
-def pytest_report_teststatus(report, config):
-    test_name = report.head_line
-    when = report.when
-    call_str = "call"
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_teardown(item, nextitem):
+    BASIC_LOGGER.info(TEARDOWN_SEPARATOR)
 
-    if report.passed:
-        if when == call_str:
-            BASIC_LOGGER.info(f"\nTEST: {test_name} STATUS: \033[0;32mPASSED\033[0m")
+    # Runs before pytest tears down the fixtures. On the class's (or module's) last test, wait for its must-gathers
+    # so they collect the namespace, VMs and plan before the class fixtures delete them.
+    scope_node = item.getparent(pytest.Class) or item.getparent(pytest.Module)
+    if scope_node and (nextitem is None or scope_node not in nextitem.listchain()):
+        wait(MUST_GATHER_FUTURES.get(scope_node.nodeid, {}).values())
 
-    elif report.skipped:
-        BASIC_LOGGER.info(f"\nTEST: {test_name} STATUS: \033[1;33mSKIPPED\033[0m")
 
-    elif report.failed:
-        if when != call_str:
-            BASIC_LOGGER.info(f"\nTEST: {test_name} [{when}] STATUS: \033[0;31mERROR\033[0m")
-        else:
-            BASIC_LOGGER.info(f"\nTEST: {test_name} STATUS: \033[0;31mFAILED\033[0m")
+def pytest_report_teststatus(report, config):
+    if status_format := TEST_STATUS_FORMATS.get((report.outcome, report.when)):
+        BASIC_LOGGER.info(status_format.format(test_name=report.head_line))
 
 
 def pytest_sessionfinish(session, exitstatus):
@@ -225,6 +244,9 @@ def pytest_sessionfinish(session, exitstatus):
 
     BASIC_LOGGER.info(f"{separator(symbol_='-', val='SESSION FINISH')}")
 
+    # must-gather may target plans that the session teardown deletes, wait for it first
+    MUST_GATHER_EXECUTOR.shutdown(wait=True)
+
     _session_store = get_fixture_store(session)
 
     _data_collector_path = Path(session.config.getoption("data_collector_path"))
@@ -244,7 +266,11 @@ def pytest_sessionfinish(session, exitstatus):
             if not session.config.getoption("skip_data_collector"):
                 run_must_gather(data_collector_path=_data_collector_path)
 
-    shutil.rmtree(path=session.config.option.basetemp, ignore_errors=True)
+    # xdist workers get their basetemp under the controller's one, the controller removes the whole tree once.
+    # basetemp is None when pytest.ini addopts are overridden, never hand that to fast_rmtree (scans the cwd)
+    if (basetemp := session.config.option.basetemp) and not hasattr(session.config, "workerinput"):
+        fast_rmtree(path=basetemp)
+
     reporter = session.config.pluginmanager.get_plugin("terminalreporter")
     reporter.summary_stats()
 
@@ -320,26 +346,35 @@ def pytest_collection_modifyitems(session, config, items):
 
     _session_store = get_fixture_store(session)
     vms_for_current_session: set = set()
+    seen_vm_lists: set[int] = set()
+    item_name_suffix = f"-{py_config.get('source_provider')}-{py_config.get('storage_class')}"
+
+    tests_params = py_config["tests_params"]
 
     for item in items:
-        item.name = f"{item.name}-{py_config.get('source_provider')}-{py_config.get('storage_class')}"
+        item.name += item_name_suffix
 
         # Get test config from parametrization or tests_params
         test_config = None
-        if hasattr(item, "callspec"):
-            # Class-based tests use class_plan_config
-            test_config = item.callspec.params.get("class_plan_config")
+        if (callspec := getattr(item, "callspec", None)) is not None:
+            # Class-based tests use class_plan_config, function-based tests use plan
+            test_config = callspec.params.get("class_plan_config")
             if test_config is None:
-                # Function-based tests use plan
-                test_config = item.callspec.params.get("plan")
+                test_config = callspec.params.get("plan")
 
         if test_config is None:
             # Fallback to looking up by test name (for non-parametrized tests)
-            test_config = py_config["tests_params"].get(item.originalname)
+            test_config = tests_params.get(item.originalname)
+
+        if not test_config or (vm_list := test_config.get("virtual_machines")) is None:
+            continue
 
-        if test_config and "virtual_machines" in test_config:
-            for _vm in test_config["virtual_machines"]:
-                vms_for_current_session.add(_vm["name"])
+        # every test in a class shares the same VMs list, add its names once
+        if id(vm_list) in seen_vm_lists:
+            continue
+
+        seen_vm_lists.add(id(vm_list))
+        vms_for_current_session.update(_vm["name"] for _vm in vm_list)
 
     _session_store["vms_for_current_session"] = vms_for_current_session
 
@@ -351,7 +386,11 @@ def pytest_exception_interact(node, call, report):
     if is_dry_run(node.session.config):
         return
 
-    if not node.session.config.getoption("skip_data_collector"):
+    scope_node = node.getparent(pytest.Class) or node.getparent(pytest.Module)
+    scope_must_gathers = MUST_GATHER_FUTURES.setdefault(scope_node.nodeid if scope_node else node.nodeid, {})
+
+    # A test can fail in more than one phase, collect once per test
+    if not node.session.config.getoption("skip_data_collector") and node.name not in scope_must_gathers:
         _session_store = get_fixture_store(node.session)
         _data_collector_path = Path(f"{node.session.config.getoption('data_collector_path')}/{node.name}")
         # Handle both function-based tests and class-based tests
@@ -360,46 +399,41 @@ def pytest_exception_interact(node, call, report):
         plan = [plan for plan in plans if plan.get("test_name", "") == test_name]
         plan = plan[0] if plan else None
 
-        run_must_gather(data_collector_path=_data_collector_path, plan=plan)
+        scope_must_gathers[node.name] = MUST_GATHER_EXECUTOR.submit(
+            run_must_gather, data_collector_path=_data_collector_path, plan=plan
+        )
 
 
 # https://smarie.github.io/python-pytest-harvest/#pytest-x-dist
 def pytest_harvest_xdist_init():
-    # reset the recipient folder
-    if RESULTS_PATH.exists():
-        rmtree(RESULTS_PATH)
+    # reset the recipient folder, runs on the controller's session start before any worker is started
+    reset_xdist_results_dir(results_path=RESULTS_PATH)
 
-    RESULTS_PATH.mkdir(exist_ok=False)
     return True
 
 
 def pytest_harvest_xdist_worker_dump(worker_id, session_items, fixture_store):
-    # persist session_items and fixture_store in the file system
-    with open(RESULTS_PATH / (f"{worker_id}.pkl"), "wb") as f:
-        try:
-            pickle.dump((session_items, fixture_store), f)
-        except Exception as exp:
-            LOGGER.warning(f"Error while pickling worker {worker_id}'s harvested results: [{exp.__class__}] {exp}")
+    # persist session_items and fixture_store in the file system, each worker atomically replaces its own file
+    dump_xdist_worker_results(
+        results_path=RESULTS_PATH, worker_id=worker_id, session_items=session_items, fixture_store=fixture_store
+    )
 
     return True
 
 
 def pytest_harvest_xdist_load():
     # restore the saved objects from file system
-    workers_saved_material = {}
-
-    for pkl_file in RESULTS_PATH.glob("*.pkl"):
-        wid = pkl_file.stem
-
-        with pkl_file.open("rb") as f:
-            workers_saved_material[wid] = pickle.load(f)
-
-    return workers_saved_material
+    return load_xdist_worker_results(results_path=RESULTS_PATH)
 
 
 def pytest_harvest_xdist_cleanup():
-    # delete all temporary pickle files
-    rmtree(RESULTS_PATH)
+    # result files are unlinked as they are loaded, only the (normally empty) folder is left
+    try:
+        RESULTS_PATH.rmdir()
+    except FileNotFoundError:
+        pass
+    except OSError:
+        fast_rmtree(path=RESULTS_PATH)
     return True
 
 
@@ -408,9 +442,11 @@ def pytest_harvest_xdist_cleanup():
 
 @pytest.fixture(scope="session", autouse=True)
 def autouse_fixtures(
-    source_provider_data, nfs_storage_profile, base_resource_name, forklift_pods_state, virtctl_binary
+    source_provider_data, forklift_pods_state, nfs_storage_profile, base_resource_name, virtctl_binary
 ):
     # source_provider_data called here to fail fast in provider not found in the providers list from config
+    # forklift_pods_state waits for the forklift pods in the background while the other session fixtures are set up
+    forklift_pods_state.result()
     yield
 
 
@@ -426,7 +462,7 @@ def base_resource_name(fixture_store, session_uuid, source_provider_data):
 
 
 @pytest.fixture(scope="session")
-def source_providers(request: pytest.FixtureRequest) -> dict[str, dict[str, Any]]:
+def source_providers(request: pytest.FixtureRequest) -> Mapping[str, dict[str, Any]]:
     providers_json_path = request.config.getoption("providers_json")
     return load_source_providers(providers_json_path=providers_json_path)
 
@@ -526,6 +562,8 @@ def virtctl_binary(ocp_admin_client: "DynamicClient") -> Path:
 
     Uses file locking to handle pytest-xdist parallel execution safely.
     The binary is downloaded to a shared directory that all workers can access.
+    A `.ready` marker written after a successful download lets workers skip the lock
+    when the binary is already cached.
     The directory includes the cluster version for automatic cache invalidation
     when switching between clusters with different versions.
 
@@ -572,19 +610,26 @@ def virtctl_binary(ocp_admin_client: "DynamicClient") -> Path:
 
     lock_file = shared_dir / "virtctl.lock"
     virtctl_path = shared_dir / "virtctl"
+    # Written atomically once the binary is in place, lets workers skip the lock on a warm cache
+    ready_file = shared_dir / ".ready"
 
-    try:
-        # File lock ensures only one process downloads
-        with filelock.FileLock(lock_file, timeout=600):
-            if not virtctl_path.is_file() or not os.access(virtctl_path, os.X_OK):
-                download_virtctl_from_cluster(client=ocp_admin_client, download_dir=shared_dir)
-                # Validate binary was downloaded successfully
+    if not (ready_file.is_file() and virtctl_path.is_file() and os.access(virtctl_path, os.X_OK)):
+        try:
+            # File lock ensures only one process downloads
+            with filelock.FileLock(lock_file, timeout=600):
                 if not virtctl_path.is_file() or not os.access(virtctl_path, os.X_OK):
-                    raise ValueError(f"Failed to download or make executable virtctl at {virtctl_path}")
-    except filelock.Timeout as err:
-        raise TimeoutError(
-            f"Timeout (600s) waiting for virtctl lock at {lock_file}. Another process may be stuck."
-        ) from err
+                    download_virtctl_from_cluster(client=ocp_admin_client, download_dir=shared_dir)
+                    # Validate binary was downloaded successfully
+                    if not virtctl_path.is_file() or not os.access(virtctl_path, os.X_OK):
+                        raise ValueError(f"Failed to download or make executable virtctl at {virtctl_path}")
+
+                ready_tmp_file = shared_dir / ".ready.tmp"
+                ready_tmp_file.write_text(cluster_version_str)
+                os.replace(ready_tmp_file, ready_file)
+        except filelock.Timeout as err:
+            raise TimeoutError(
+                f"Timeout (600s) waiting for virtctl lock at {lock_file}. Another process may be stuck."
+            ) from err
 
     # Add to PATH for all workers
     add_to_path(str(shared_dir))
@@ -604,7 +649,8 @@ def precopy_interval_forkliftcontroller(ocp_admin_client, mtv_namespace):
     )
 
     snapshots_interval = py_config["snapshots_interval"]
-    forklift_controller.wait_for_condition(
+    wait_for_condition_watch(
+        resource=forklift_controller,
         status=forklift_controller.Condition.Status.TRUE,
         condition=forklift_controller.Condition.Type.RUNNING,
         timeout=300,
@@ -623,7 +669,8 @@ def precopy_interval_forkliftcontroller(ocp_admin_client, mtv_namespace):
             }
         }
     ):
-        forklift_controller.wait_for_condition(
+        wait_for_condition_watch(
+            resource=forklift_controller,
             status=forklift_controller.Condition.Status.TRUE,
             condition=forklift_controller.Condition.Type.SUCCESSFUL,
             timeout=300,
@@ -653,14 +700,14 @@ def destination_provider(session_uuid, ocp_admin_client, target_namespace, fixtu
 
 @pytest.fixture(scope="session")
 def source_provider_data(
-    source_providers: dict[str, dict[str, Any]],
+    source_providers: Mapping[str, dict[str, Any]],
     fixture_store: dict[str, Any],
     request: pytest.FixtureRequest,
 ) -> dict[str, Any]:
     """Resolve source provider configuration from the loaded providers data.
 
     Args:
-        source_providers (dict[str, dict[str, Any]]): All provider configurations loaded from providers JSON file.
+        source_providers (Mapping[str, dict[str, Any]]): All provider configurations loaded from providers JSON file.
         fixture_store (dict[str, Any]): Session fixture store for teardown tracking.
         request (pytest.FixtureRequest): Pytest request object to access CLI options.
 
@@ -671,19 +718,21 @@ def source_provider_data(
         MissingProvidersFileError: If providers data is empty.
         ValueError: If the requested provider is not found.
     """
-    providers_path = resolve_providers_json_path(cli_path=request.config.getoption("providers_json"))
+    requested_provider = py_config["source_provider"]
+    _source_provider = source_providers.get(requested_provider)
 
-    if not source_providers:
-        raise MissingProvidersFileError(path=providers_path)
+    if _source_provider is None:
+        # The path is only needed to report the failure
+        providers_path = resolve_providers_json_path(cli_path=request.config.getoption("providers_json"))
+
+        if not source_providers:
+            raise MissingProvidersFileError(path=providers_path)
 
-    requested_provider = py_config["source_provider"]
-    if requested_provider not in source_providers:
         raise ValueError(
             f"Source provider '{requested_provider}' not found in '{providers_path}'. "
             f"Available providers: {sorted(source_providers.keys())}"
         )
 
-    _source_provider = source_providers[requested_provider]
     fixture_store["source_provider_data"] = _source_provider
     return _source_provider
 
@@ -778,27 +827,33 @@ def multus_network_name(
     # Calculate how many multus NADs we need (all networks except the first one)
     multus_count = max(0, len(networks) - 1)  # First network goes to pod, rest to multus
 
-    created_nads = []
     # Create all required NADs with consistent naming
+    # Use the provided config for the first NAD, custom config for others
+    nad_configs: dict[str, str] = {}
     for i in range(1, multus_count + 1):
         nad_name = f"{base_name}-{i}"
-
-        # Use the provided config for the first NAD, custom config for others
-        if i == 1:
-            config = multus_cni_config
-        else:
-            cni_config = {"cniVersion": "0.3.1", "type": "bridge", "bridge": nad_name}
-            config = json.dumps(cni_config)
-
-        create_and_store_resource(
-            fixture_store=fixture_store,
-            resource=NetworkAttachmentDefinition,
-            client=ocp_admin_client,
-            namespace=nad_namespace,
-            config=config,
-            name=nad_name,
+        nad_configs[nad_name] = (
+            multus_cni_config if i == 1 else json.dumps({"cniVersion": "0.3.1", "type": "bridge", "bridge": nad_name})
         )
 
+    # Each create waits for its NAD, the NADs are independent so create them concurrently
+    with ThreadPoolExecutor(max_workers=min(len(nad_configs), 10) or 1) as executor:
+        nad_futures = {
+            nad_name: executor.submit(
+                create_and_store_resource,
+                fixture_store=fixture_store,
+                resource=NetworkAttachmentDefinition,
+                client=ocp_admin_client,
+                namespace=nad_namespace,
+                config=config,
+                name=nad_name,
+            )
+            for nad_name, config in nad_configs.items()
+        }
+
+    created_nads = []
+    for nad_name, nad_future in nad_futures.items():
+        nad_future.result()
         created_nads.append(nad_name)
         LOGGER.info(f"Created NAD: {nad_name} in namespace {nad_namespace}")
 
@@ -885,13 +940,12 @@ def class_plan_config(request: pytest.FixtureRequest) -> dict[str, Any]:
 
 @pytest.fixture(scope="class")
 def prepared_plan(
-    request: pytest.FixtureRequest,
     class_plan_config: dict[str, Any],
     fixture_store: dict[str, Any],
     source_provider: Any,
     source_vms_namespace: str,
+    source_vms_network: str | None,
     ocp_admin_client: DynamicClient,
-    multus_cni_config: str,
     source_provider_inventory: ForkliftInventory,
     target_namespace: str,
 ) -> Generator[dict[str, Any], None, None]:
@@ -902,13 +956,12 @@ def prepared_plan(
     once per test class rather than once per test function.
 
     Args:
-        request (pytest.FixtureRequest): Pytest fixture request
         class_plan_config (dict[str, Any]): Plan configuration from parametrization
         fixture_store (dict[str, Any]): Fixture store for resource tracking
         source_provider: Source provider instance (VMWareProvider, OvirtProvider, etc.)
         source_vms_namespace (str): Source VMs namespace
+        source_vms_network (str | None): Source VMs network (OpenShift source provider only)
         ocp_admin_client (DynamicClient): OpenShift client
-        multus_cni_config (str): Multus CNI configuration
         source_provider_inventory (ForkliftInventory): Source provider inventory
         target_namespace (str): Default target namespace for VMs
 
@@ -916,8 +969,11 @@ def prepared_plan(
         dict[str, Any]: Prepared plan with updated VM names
     """
 
-    # Deep copy the plan config to avoid mutation
-    plan: dict[str, Any] = deepcopy(class_plan_config)
+    # Copy the plan config and its VM entries to avoid mutation, nested values are only read
+    plan: dict[str, Any] = {
+        **class_plan_config,
+        "virtual_machines": [dict(vm) for vm in class_plan_config["virtual_machines"]],
+    }
     virtual_machines: list[dict[str, Any]] = plan["virtual_machines"]
     warm_migration = plan.get("warm_migration", False)
 
@@ -937,117 +993,56 @@ def prepared_plan(
     else:
         plan["_vm_target_namespace"] = target_namespace
 
-    # Override VM names from provider config if specified
-    if hasattr(source_provider, "copyoffload_config") and source_provider.copyoffload_config:
-        default_vm_override = source_provider.copyoffload_config.get("default_vm_name")
-        if default_vm_override:
-            for vm in virtual_machines:
-                if vm.get("clone", False):  # Only override for cloned VMs
-                    LOGGER.info(f"Overriding VM name '{vm['name']}' with '{default_vm_override}' from provider config")
-                    vm["name"] = default_vm_override
-
-    # OVA provider uses a fixed VM from the OVA file
-    if source_provider.type == Provider.ProviderType.OVA:
+    source_provider_type = source_provider.type
+
+    if source_provider_type == Provider.ProviderType.OVA:
+        # OVA provider uses a fixed VM from the OVA file, there is nothing to clone or wait for
         plan["virtual_machines"] = [{"name": "1nisim-rhel9-efi"}]
 
-    if source_provider.type != Provider.ProviderType.OVA:
-        openshift_source_provider: bool = source_provider.type == Provider.ProviderType.OPENSHIFT
+    else:
+        # Override VM names from provider config if specified
+        if hasattr(source_provider, "copyoffload_config") and source_provider.copyoffload_config:
+            default_vm_override = source_provider.copyoffload_config.get("default_vm_name")
+            if default_vm_override:
+                for vm in virtual_machines:
+                    if vm.get("clone", False):  # Only override for cloned VMs
+                        LOGGER.info(
+                            f"Overriding VM name '{vm['name']}' with '{default_vm_override}' from provider config"
+                        )
+                        vm["name"] = default_vm_override
+
+        openshift_source_provider: bool = source_provider_type == Provider.ProviderType.OPENSHIFT
 
         vm_name_suffix = get_vm_suffix(warm_migration=warm_migration)
 
         if openshift_source_provider:
-            # Generate unique network name for class-based tests
-            hash_prefix = generate_class_hash_prefix(request.node.nodeid)
-            multus_network_name = f"cb-{hash_prefix}"
-
-            # Create NAD for OpenShift source provider
-            create_and_store_resource(
-                fixture_store=fixture_store,
-                resource=NetworkAttachmentDefinition,
-                client=ocp_admin_client,
-                namespace=source_vms_namespace,
-                config=multus_cni_config,
-                name=multus_network_name,
-            )
+            if not source_vms_network:
+                raise ValueError("source_vms_network is not set for an OpenShift source provider")
 
             create_source_cnv_vms(
                 fixture_store=fixture_store,
                 client=ocp_admin_client,
                 vms=virtual_machines,
                 namespace=source_vms_namespace,
-                network_name=multus_network_name,
-                vm_name_suffix=vm_name_suffix,
-            )
-
-        for vm in virtual_machines:
-            # Get VM object first (without full vm_dict analysis)
-            # Add enable_ctk flag for warm migrations
-            clone_options = {**vm, "enable_ctk": warm_migration}
-            provider_vm_api = source_provider.get_vm_by_name(
-                query=vm["name"],
-                vm_name_suffix=vm_name_suffix,
-                clone_vm=True,
-                session_uuid=fixture_store["session_uuid"],
-                clone_options=clone_options,
-            )
-
-            # Power state control: "on" = start VM, "off" = stop VM, not set = leave unchanged
-            source_vm_power = vm.get("source_vm_power")  # Optional - if not set, VM power state unchanged
-            if source_vm_power == "on":
-                source_provider.start_vm(provider_vm_api)
-                # Wait for guest info to become available (VMware only)
-                if source_provider.type == Provider.ProviderType.VSPHERE:
-                    source_provider.wait_for_vmware_guest_info(provider_vm_api, timeout=120)
-            elif source_vm_power == "off":
-                source_provider.stop_vm(provider_vm_api)
-
-            # NOW call vm_dict() with VM in correct power state for guest info
-            source_vm_details = source_provider.vm_dict(
-                provider_vm_api=provider_vm_api,
-                name=vm["name"],
-                namespace=source_vms_namespace,
-                clone=False,  # Already cloned above
+                network_name=source_vms_network,
                 vm_name_suffix=vm_name_suffix,
-                session_uuid=fixture_store["session_uuid"],
-                clone_options=vm,
             )
-            vm["name"] = source_vm_details["name"]
 
-            # Wait for cloned VM to appear in Forklift inventory before proceeding
-            # This is needed for external providers that Forklift needs to sync from
-            # OVA is excluded because it doesn't clone VMs (uses pre-existing files)
-            if source_provider.type != Provider.ProviderType.OVA:
-                source_provider_inventory.wait_for_vm(name=vm["name"], timeout=300)
-
-            provider_vm_api = source_vm_details["provider_vm_api"]
+        source_vms_details = prepare_source_vms(
+            virtual_machines=virtual_machines,
+            source_provider=source_provider,
+            source_provider_inventory=source_provider_inventory,
+            fixture_store=fixture_store,
+            source_vms_namespace=source_vms_namespace,
+            vm_name_suffix=vm_name_suffix,
+            warm_migration=warm_migration,
+            preserve_static_ips=bool(plan.get("preserve_static_ips")),
+        )
 
-            vm["snapshots_before_migration"] = source_vm_details["snapshots_data"]
+        for vm, source_vm_details in zip(virtual_machines, source_vms_details):
             # Store complete source VM data separately (keeps virtual_machines clean for Plan CR serialization)
             plan["source_vms_data"][vm["name"]] = source_vm_details
 
-            # Detect IP origins via Guest Operations for Linux VMs where VMware doesn't report origin
-            # (known open-vm-tools limitation: https://github.com/vmware/open-vm-tools/issues/694)
-            if source_provider.type == Provider.ProviderType.VSPHERE and not source_vm_details.get("win_os"):
-                try:
-                    detect_vmware_ip_origins_via_guest_ops(
-                        source_provider=source_provider,
-                        vm=provider_vm_api,
-                        source_provider_data=fixture_store["source_provider_data"],
-                        vm_details=source_vm_details,
-                    )
-                except ValueError:
-                    raise
-                except Exception as e:
-                    if plan.get("preserve_static_ips"):
-                        raise ValueError(
-                            f"Failed to detect IP origins via Guest Operations for VM {vm['name']}: {e}. "
-                            "IP origin detection is required when preserve_static_ips is enabled."
-                        ) from e
-                    LOGGER.warning(
-                        f"Failed to detect IP origins via Guest Operations for VM {vm['name']}: {e}. "
-                        "Static IP verification may not work for this VM."
-                    )
-
     # Create Hooks if configured
     create_hook_if_configured(plan, "pre_hook", "pre", fixture_store, ocp_admin_client, target_namespace)
     create_hook_if_configured(plan, "post_hook", "post", fixture_store, ocp_admin_client, target_namespace)
@@ -1262,22 +1257,19 @@ def cleanup_migrated_vms(
     # Use custom namespace if configured, otherwise fall back to target_namespace
     vm_namespace = prepared_plan.get("_vm_target_namespace", target_namespace)
 
-    for vm in prepared_plan["virtual_machines"]:
-        vm_name = vm["name"]
-        vm_obj = VirtualMachine(
-            client=ocp_admin_client,
-            name=vm_name,
-            namespace=vm_namespace,
+    # VM deletions are independent, wait for them concurrently
+    vm_names = [vm["name"] for vm in prepared_plan["virtual_machines"]]
+    with ThreadPoolExecutor(max_workers=min(len(vm_names), 10) or 1) as executor:
+        list(
+            executor.map(
+                functools.partial(delete_vm_if_exists, ocp_admin_client, namespace=vm_namespace),
+                vm_names,
+            )
         )
-        if vm_obj.exists:
-            LOGGER.info(f"Cleaning up migrated VM: {vm_name} from namespace: {vm_namespace}")
-            vm_obj.clean_up()
-        else:
-            LOGGER.info(f"VM {vm_name} already deleted from namespace: {vm_namespace}, skipping cleanup")
 
 
 @pytest.fixture(scope="session")
-def forklift_pods_state(ocp_admin_client: DynamicClient) -> None:
+def forklift_pods_state(ocp_admin_client: DynamicClient) -> Generator[Future[None], None, None]:
     mtv_namespace: str = py_config["mtv_namespace"]
     try:
         mtv_subscription = Subscription(
@@ -1295,35 +1287,75 @@ def forklift_pods_state(ocp_admin_client: DynamicClient) -> None:
     except NotFoundError:
         raise MtvOperatorNotInstalledError(namespace=mtv_namespace)
 
-    def _get_not_running_pods(_admin_client: DynamicClient) -> bool:
-        controller_pod: Pod | None = None
-        not_running_pods: list[str] = []
+    def _get_not_running_pods(pods_phase: dict[str, str | None]) -> list[str]:
+        forklift_pods_phase = {name: phase for name, phase in pods_phase.items() if name.startswith("forklift-")}
+
+        if not any(name.startswith("forklift-controller") for name in forklift_pods_phase):
+            return ["forklift-controller"]
 
-        for pod in Pod.get(client=_admin_client, namespace=mtv_namespace):
-            if pod.name.startswith("forklift-"):
-                if pod.name.startswith("forklift-controller"):
-                    controller_pod = pod
+        return [
+            name
+            for name, phase in forklift_pods_phase.items()
+            if phase not in (Pod.Status.RUNNING, Pod.Status.SUCCEEDED)
+        ]
 
-                if pod.status not in (pod.Status.RUNNING, pod.Status.SUCCEEDED):
-                    not_running_pods.append(pod.name)
+    def _get_pods_phase(label_selector: str = "") -> dict[str, str | None]:
+        return {
+            pod.metadata.name: pod.status.phase if pod.status else None
+            for pod in Pod.get(
+                client=ocp_admin_client, namespace=mtv_namespace, label_selector=label_selector, raw=True
+            )
+        }
 
-        if not controller_pod:
-            raise ForkliftPodsNotRunningError("Forklift controller pod not found")
+    def _wait_for_forklift_pods() -> None:
+        deadline = time.monotonic() + 60 * 5
+        not_running_pods: list[str] = []
 
-        if not_running_pods:
+        while not stop_waiting.is_set() and (remaining := int(deadline - time.monotonic())) > 0:
+            try:
+                listed_at = time.monotonic()
+                # The label selector keeps the API server from sending unrelated pods of the namespace.
+                # Not every deployment is known to label all forklift pods, list them all if the controller is missing
+                pods_phase = _get_pods_phase(label_selector=FORKLIFT_PODS_LABEL_SELECTOR)
+                if not any(name.startswith("forklift-controller") for name in pods_phase):
+                    pods_phase = _get_pods_phase()
+
+                if not (not_running_pods := _get_not_running_pods(pods_phase=pods_phase)):
+                    return
+
+                if not_running_pods[0] not in pods_phase:
+                    # No controller pod yet and the wrapper only watches named pods, poll the list once a second.
+                    # Only sleep what is left of the second, a slow list already used up part of it.
+                    stop_waiting.wait(max(1 - (time.monotonic() - listed_at), 0))
+                    continue
+
+                # Watch the pod instead of re-listing the namespace on every poll, list again once it is up or gone
+                # The watch is bounded so a stop request from the fixture teardown is noticed quickly
+                pod = Pod(client=ocp_admin_client, name=not_running_pods[0], namespace=mtv_namespace)
+                for event in pod.watcher(timeout=min(remaining, 10)):
+                    if event["type"] == "DELETED" or (event["raw_object"].get("status") or {}).get("phase") in (
+                        Pod.Status.RUNNING,
+                        Pod.Status.SUCCEEDED,
+                    ):
+                        break
+
+            # Pods can be replaced while they are checked (e.g. a forklift rollout), list them again
+            except NotFoundError:
+                continue
+
+        if not stop_waiting.is_set():
             raise ForkliftPodsNotRunningError(f"Some of the forklift pods are not running: {not_running_pods}")
 
-        return True
-
-    for sample in TimeoutSampler(
-        func=_get_not_running_pods,
-        _admin_client=ocp_admin_client,
-        sleep=1,
-        wait_timeout=60 * 5,
-        exceptions_dict={ForkliftPodsNotRunningError: [], NotFoundError: []},
-    ):
-        if sample:
-            return
+    # Wait in the background so the rest of the session setup overlaps with it, `autouse_fixtures` joins the wait.
+    # No executor context manager: when the setup fails before the join, teardown stops the wait instead of
+    # blocking until the watch times out.
+    stop_waiting = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="forklift-pods")
+    try:
+        yield executor.submit(_wait_for_forklift_pods)
+    finally:
+        stop_waiting.set()
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 @pytest.fixture(scope="session")
@@ -1333,14 +1365,7 @@ def source_provider_inventory(
     if not source_provider.ocp_resource:
         raise ValueError("source_provider.ocp_resource is not set")
 
-    providers = {
-        Provider.ProviderType.OVA: OvaForkliftInventory,
-        Provider.ProviderType.RHV: OvirtForkliftInventory,
-        Provider.ProviderType.VSPHERE: VsphereForkliftInventory,
-        Provider.ProviderType.OPENSHIFT: OpenshiftForkliftInventory,
-        Provider.ProviderType.OPENSTACK: OpenstackForliftinventory,
-    }
-    provider_instance = providers.get(source_provider.type)
+    provider_instance = FORKLIFT_INVENTORY_BY_PROVIDER_TYPE.get(source_provider.type)
 
     if not provider_instance:
         raise ValueError(f"Provider {source_provider.type} not implemented")
@@ -1363,8 +1388,45 @@ def source_vms_namespace(source_provider, fixture_store, ocp_admin_client, sessi
         return namespace.name
 
 
+@pytest.fixture(scope="session")
+def source_vms_network(
+    source_provider: Any,
+    source_vms_namespace: str,
+    session_uuid: str,
+    fixture_store: dict[str, Any],
+    ocp_admin_client: DynamicClient,
+    multus_cni_config: str,
+) -> str | None:
+    """Create the network the cloned source VMs are attached to.
+
+    The source VMs namespace is unique per session and every class attaches its VMs
+    to the same network, so one NAD is shared instead of creating one per class.
+
+    Args:
+        source_provider: Source provider instance (VMWareProvider, OvirtProvider, etc.)
+        source_vms_namespace (str): Source VMs namespace
+        session_uuid (str): Unique identifier of the test session
+        fixture_store (dict[str, Any]): Fixture store for resource tracking
+        ocp_admin_client (DynamicClient): OpenShift client
+        multus_cni_config (str): CNI configuration of the NAD
+
+    Returns:
+        str | None: Name of the NAD for an OpenShift source provider, None otherwise
+    """
+    if source_provider.type != Provider.ProviderType.OPENSHIFT:
+        return None
+
+    nad = create_and_store_resource(
+        resource=NetworkAttachmentDefinition,
+        fixture_store=fixture_store,
+        client=ocp_admin_client,
+        namespace=source_vms_namespace,
+        config=multus_cni_config,
+        name=f"{session_uuid}-source-vms-network",
+    )
+    return nad.name
+
+
 @pytest.fixture(scope="session")
 def multus_cni_config() -> str:
-    bridge_type_and_name = "cnv-bridge"
-    config = {"cniVersion": "0.3.1", "type": f"{bridge_type_and_name}", "bridge": f"{bridge_type_and_name}"}
-    return json.dumps(config)
+    return MULTUS_CNI_CONFIG
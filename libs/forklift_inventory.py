@@ -60,11 +60,13 @@ class ForkliftInventory(abc.ABC):
         return self._request(url_path=self.vms_path)
 
     def get_vm(self, name: str) -> dict[str, Any]:
-        for _vm in self.vms:
+        # List once, the same listing is used for the error message (wait_for_vm polls this on every miss)
+        _vms = self.vms
+        for _vm in _vms:
             if _vm["name"] == name:
                 return self._request(url_path=f"{self.vms_path}/{_vm['id']}")
 
-        raise ValueError(f"VM {name} not found. Available VMs: {self.vms_names}")
+        raise ValueError(f"VM {name} not found. Available VMs: {[_vm['name'] for _vm in _vms]}")
 
     def _check_openstack_volumes_synced(self, vm: dict[str, Any], vm_name: str) -> bool:
         """Verify OpenStack VM's attached volumes are synced and queryable.
@@ -233,10 +233,11 @@ class OCPProvider(BaseProvider):
             LOGGER.debug("Could not retrieve node name for VM %s", cnv_vm_name)
             result_vm_info["node_name"] = None
 
+        # Each .instance access is a GET, fetch the VMI spec once for the networks, volumes and domain below
+        vmi_spec = cnv_vm.vmi.instance.spec
+
         for interface in cnv_vm.vmi.interfaces:
-            matching_networks = [
-                network for network in cnv_vm.vmi.instance.spec.networks if network.name == interface.name
-            ]
+            matching_networks = [network for network in vmi_spec.networks if network.name == interface.name]
 
             if not matching_networks:
                 LOGGER.debug(
@@ -254,7 +255,7 @@ class OCPProvider(BaseProvider):
             })
 
         disk_idx = 0
-        for pvc in cnv_vm.vmi.instance.spec.volumes:
+        for pvc in vmi_spec.volumes:
             if not _source:
                 name = pvc.persistentVolumeClaim.claimName
             else:
@@ -268,26 +269,25 @@ class OCPProvider(BaseProvider):
                 name=name,
                 client=dynamic_client,
             )
+            _pvc_spec = _pvc.instance.spec
             result_vm_info["disks"].append({
                 "name": _pvc.name,
-                "size_in_kb": int(
-                    humanfriendly.parse_size(_pvc.instance.spec.resources.requests.storage, binary=True) / 1024
-                ),
+                "size_in_kb": int(humanfriendly.parse_size(_pvc_spec.resources.requests.storage, binary=True) / 1024),
                 "storage": {
-                    "name": _pvc.instance.spec.storageClassName,
-                    "access_mode": _pvc.instance.spec.accessModes,
+                    "name": _pvc_spec.storageClassName,
+                    "access_mode": _pvc_spec.accessModes,
                 },
                 "device_key": _pvc.name,  # PVC name as unique identifier
                 "unit_number": disk_idx,  # Order in volumes list (excluding cloud-init)
             })
             disk_idx += 1
 
-        result_vm_info["cpu"]["num_cores"] = cnv_vm.vmi.instance.spec.domain.cpu.cores
-        result_vm_info["cpu"]["num_sockets"] = cnv_vm.vmi.instance.spec.domain.cpu.sockets
+        result_vm_info["cpu"]["num_cores"] = vmi_spec.domain.cpu.cores
+        result_vm_info["cpu"]["num_sockets"] = vmi_spec.domain.cpu.sockets
 
         result_vm_info["memory_in_mb"] = int(
             humanfriendly.parse_size(
-                cnv_vm.vmi.instance.spec.domain.memory.guest,
+                vmi_spec.domain.memory.guest,
                 binary=True,
             )
             / 1024
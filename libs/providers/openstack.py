@@ -12,7 +12,6 @@ from simple_logger.logger import get_logger
 
 from exceptions.exceptions import VmNotFoundError
 from libs.base_provider import BaseProvider
-from utilities.naming import generate_name_with_uuid
 
 if TYPE_CHECKING:
     from libs.forklift_inventory import ForkliftInventory
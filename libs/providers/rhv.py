@@ -15,7 +15,6 @@ from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 
 from exceptions.exceptions import OvirtMTVDatacenterNotFoundError, OvirtMTVDatacenterStatusError, VmNotFoundError
 from libs.base_provider import BaseProvider
-from utilities.naming import generate_name_with_uuid
 
 if TYPE_CHECKING:
     from libs.forklift_inventory import ForkliftInventory
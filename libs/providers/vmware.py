@@ -3,6 +3,8 @@ from __future__ import annotations
 import base64
 import copy
 import ipaddress
+import time
+from contextlib import suppress
 from typing import TYPE_CHECKING, Any, Literal, Self
 
 import shortuuid
@@ -11,7 +13,7 @@ from ocp_resources.provider import Provider
 from ocp_resources.resource import Resource, ResourceEditor
 from ocp_resources.secret import Secret
 from pyVim.connect import Disconnect, SmartConnect
-from pyVmomi import vim
+from pyVmomi import vim, vmodl
 from simple_logger.logger import get_logger
 from timeout_sampler import TimeoutExpiredError, TimeoutSampler
 
@@ -1405,23 +1407,50 @@ class VMWareProvider(BaseProvider):
         """
         LOGGER.info(f"Waiting for VMware Tools guest info for VM {vm.name} (timeout: {timeout}s)")
 
+        # vCenter pushes property changes through WaitForUpdatesEx instead of the VM being re-read on every poll.
+        # A private collector keeps concurrent waits (one per VM) from consuming each other's update versions.
+        guest_info: dict[str, Any] = {}
+        deadline = time.monotonic() + timeout
+        collector = None
+
         try:
-            for sample in TimeoutSampler(
-                wait_timeout=timeout,
-                sleep=5,
-                func=lambda: (
-                    hasattr(vm, "guest")
-                    and vm.guest
-                    and hasattr(vm, "runtime")
-                    and vm.runtime.powerState == "poweredOn"
-                    and vm.guest.net
-                    and len(vm.guest.net) > 0
-                    and vm.guest.toolsStatus in ["toolsOk", "toolsOld"]  # Accept toolsOld too
+            collector = self.content.propertyCollector.CreatePropertyCollector()
+            collector.CreateFilter(
+                vmodl.query.PropertyCollector.FilterSpec(
+                    objectSet=[vmodl.query.PropertyCollector.ObjectSpec(obj=vm, skip=False)],
+                    propSet=[
+                        vmodl.query.PropertyCollector.PropertySpec(
+                            type=vim.VirtualMachine,
+                            pathSet=["runtime.powerState", "guest.net", "guest.toolsStatus"],
+                        )
+                    ],
                 ),
-            ):
-                if sample:
+                partialUpdates=False,
+            )
+
+            version = ""
+            while (remaining := deadline - time.monotonic()) > 0:
+                update_set = collector.WaitForUpdatesEx(
+                    version, vmodl.query.PropertyCollector.WaitOptions(maxWaitSeconds=max(1, int(remaining)))
+                )
+                # None means nothing changed within maxWaitSeconds
+                if update_set is None:
+                    continue
+
+                version = update_set.version
+                for filter_update in update_set.filterSet:
+                    for object_update in filter_update.objectSet:
+                        for change in object_update.changeSet:
+                            guest_info[change.name] = change.val if change.op != "remove" else None
+
+                if (
+                    guest_info.get("runtime.powerState") == "poweredOn"
+                    and guest_info.get("guest.net")
+                    and guest_info.get("guest.toolsStatus") in ("toolsOk", "toolsOld")  # Accept toolsOld too
+                ):
                     LOGGER.info(
-                        f"VMware Tools guest info available for VM {vm.name} (tools status: {vm.guest.toolsStatus})",
+                        f"VMware Tools guest info available for VM {vm.name} "
+                        f"(tools status: {guest_info['guest.toolsStatus']})",
                     )
                     return True
 
@@ -1429,12 +1458,16 @@ class VMWareProvider(BaseProvider):
             LOGGER.warning(f"Error waiting for guest info on VM {vm.name}: {e}")
             return False
 
-        # Log diagnostic info only on timeout
-        power_state = getattr(vm.runtime, "powerState", "unknown") if hasattr(vm, "runtime") else "no runtime"
-        tools_status = getattr(vm.guest, "toolsStatus", "unknown") if hasattr(vm, "guest") and vm.guest else "no guest"
-        net_count = len(vm.guest.net) if hasattr(vm, "guest") and vm.guest and vm.guest.net else 0
+        finally:
+            if collector:
+                with suppress(Exception):
+                    collector.DestroyPropertyCollector()
+
+        # Log diagnostic info only on timeout, from the last values vCenter reported
         LOGGER.warning(
             f"Timeout waiting for VMware Tools guest info on VM {vm.name} after {timeout}s "
-            f"(power={power_state}, tools={tools_status}, networks={net_count})",
+            f"(power={guest_info.get('runtime.powerState', 'unknown')}, "
+            f"tools={guest_info.get('guest.toolsStatus', 'unknown')}, "
+            f"networks={len(guest_info.get('guest.net') or [])})",
         )
         return False
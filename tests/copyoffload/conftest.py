@@ -10,9 +10,18 @@ from simple_logger.logger import get_logger
 
 from libs.base_provider import BaseProvider
 from libs.providers.vmware import VMWareProvider
-from utilities.copyoffload_constants import SUPPORTED_VENDORS
-from utilities.copyoffload_migration import get_copyoffload_credential, wait_for_vmware_cloud_init_all_vms
-from utilities.esxi import install_ssh_key_on_esxi, remove_ssh_key_from_esxi
+from utilities.copyoffload_constants import SUPPORTED_VENDORS, VENDOR_SPECIFIC_FIELDS
+from utilities.copyoffload_migration import (
+    copyoffload_env_var_name,
+    get_copyoffload_credential,
+    wait_for_vmware_cloud_init_all_vms,
+)
+from utilities.esxi import (
+    connect_to_esxi,
+    install_ssh_key_on_esxi,
+    is_esxi_client_connected,
+    remove_ssh_key_from_esxi,
+)
 from utilities.resources import create_and_store_resource
 from utilities.utils import resolve_providers_json_path
 
@@ -47,48 +56,48 @@ def copyoffload_config(
         ValueError: If provider type is not vSphere, copyoffload config is missing,
             credentials are missing, or required parameters are missing.
     """
-    providers_path = resolve_providers_json_path(cli_path=request.config.getoption("providers_json"))
+
+    # Only resolved when a validation fails; the path is needed for the error message alone
+    def _providers_path() -> str:
+        return resolve_providers_json_path(cli_path=request.config.getoption("providers_json"))
 
     # Validate that this is a vSphere provider
     if source_provider.type != Provider.ProviderType.VSPHERE:
         raise ValueError(
             f"Copy-offload tests require vSphere provider, but got '{source_provider.type}'. "
-            f"Check your provider configuration in {providers_path}"
+            f"Check your provider configuration in {_providers_path()}"
         )
 
     # Validate copy-offload configuration exists
     if "copyoffload" not in source_provider_data:
         raise ValueError(
             "Copy-offload configuration not found in source provider data. "
-            f"Add 'copyoffload' section to your provider in {providers_path}"
+            f"Add 'copyoffload' section to your provider in {_providers_path()}"
         )
 
     config = source_provider_data["copyoffload"]
 
     # Validate required storage credentials are available (from either env vars or providers JSON)
-    required_credentials = ["storage_hostname", "storage_username", "storage_password"]
-    missing_credentials = []
-
-    for cred in required_credentials:
-        # Check if credential is available from either env var or config file
-        if not get_copyoffload_credential(cred, config):
-            missing_credentials.append(cred)
+    missing_credentials = [
+        cred
+        for cred in ("storage_hostname", "storage_username", "storage_password")
+        if not get_copyoffload_credential(cred, config)
+    ]
 
     if missing_credentials:
         raise ValueError(
             f"Required storage credentials not found: {missing_credentials}. "
-            f"Add them to {providers_path} copyoffload section or set environment variables: "
-            f"{', '.join([f'COPYOFFLOAD_{c.upper()}' for c in missing_credentials])}"
+            f"Add them to {_providers_path()} copyoffload section or set environment variables: "
+            f"{', '.join(copyoffload_env_var_name(cred) for cred in missing_credentials)}"
         )
 
     # Validate required copy-offload parameters
-    required_params = ["storage_vendor_product", "datastore_id"]
-    missing_params = [param for param in required_params if not config.get(param)]
+    missing_params = [param for param in ("storage_vendor_product", "datastore_id") if not config.get(param)]
 
     if missing_params:
         raise ValueError(
             f"Missing required copy-offload parameters in config: {', '.join(missing_params)}. "
-            f"Add them to {providers_path} copyoffload section"
+            f"Add them to {_providers_path()} copyoffload section"
         )
 
     LOGGER.info("✓ Copy-offload configuration validated successfully")
@@ -150,12 +159,17 @@ def copyoffload_storage_secret(
 
     copyoffload_cfg = source_provider_data["copyoffload"]
 
-    # Get storage credentials from environment variables or provider config
-    storage_hostname = get_copyoffload_credential("storage_hostname", copyoffload_cfg)
-    storage_username = get_copyoffload_credential("storage_username", copyoffload_cfg)
-    storage_password = get_copyoffload_credential("storage_password", copyoffload_cfg)
+    # Base secret data (required for all vendors), from environment variables or provider config
+    secret_data = {
+        secret_key: get_copyoffload_credential(config_key, copyoffload_cfg)
+        for config_key, secret_key in (
+            ("storage_hostname", "STORAGE_HOSTNAME"),
+            ("storage_username", "STORAGE_USERNAME"),
+            ("storage_password", "STORAGE_PASSWORD"),
+        )
+    }
 
-    if not all([storage_hostname, storage_username, storage_password]):
+    if not all(secret_data.values()):
         raise ValueError(
             "Storage credentials are required. Set COPYOFFLOAD_STORAGE_HOSTNAME, COPYOFFLOAD_STORAGE_USERNAME, "
             f"and COPYOFFLOAD_STORAGE_PASSWORD environment variables or include them in {providers_path}"
@@ -173,54 +187,18 @@ def copyoffload_storage_secret(
             f"Unsupported storage_vendor_product '{storage_vendor}'. Valid values: {', '.join(SUPPORTED_VENDORS)}"
         )
 
-    # Base secret data (required for all vendors)
-    secret_data = {
-        "STORAGE_HOSTNAME": storage_hostname,
-        "STORAGE_USERNAME": storage_username,
-        "STORAGE_PASSWORD": storage_password,
-    }
-
-    # Vendor-specific configuration mapping
-    # Maps vendor name to list of (config_key, secret_key, required) tuples
-    # Based on forklift vsphere-xcopy-volume-populator code and README
-    # NOTE: Keys must match SUPPORTED_VENDORS constant defined at module level
-    vendor_specific_fields = {
-        "ontap": [("ontap_svm", "ONTAP_SVM", True)],
-        "vantara": [
-            ("vantara_storage_id", "STORAGE_ID", True),
-            ("vantara_storage_port", "STORAGE_PORT", True),
-            ("vantara_hostgroup_id_list", "HOSTGROUP_ID_LIST", True),
-        ],
-        "primera3par": [],  # Only basic credentials required
-        "pureFlashArray": [("pure_cluster_prefix", "PURE_CLUSTER_PREFIX", True)],
-        "powerflex": [("powerflex_system_id", "POWERFLEX_SYSTEM_ID", True)],
-        "powermax": [("powermax_symmetrix_id", "POWERMAX_SYMMETRIX_ID", True)],
-        "powerstore": [],  # Only basic credentials required
-        "infinibox": [],  # Only basic credentials required
-        "flashsystem": [],  # Only basic credentials required
-    }
-
-    # Ensure vendor_specific_fields keys match SUPPORTED_VENDORS to prevent drift
-    missing_vendors = set(SUPPORTED_VENDORS) - set(vendor_specific_fields)
-    extra_vendors = set(vendor_specific_fields) - set(SUPPORTED_VENDORS)
-    if missing_vendors or extra_vendors:
-        raise ValueError(
-            "vendor_specific_fields keys must match SUPPORTED_VENDORS. "
-            f"Missing: {missing_vendors}. Extra: {extra_vendors}"
-        )
-
     # Add vendor-specific fields if configured
-    if storage_vendor in vendor_specific_fields:
-        for config_key, secret_key, required in vendor_specific_fields[storage_vendor]:
+    if storage_vendor in VENDOR_SPECIFIC_FIELDS:
+        for config_key, secret_key, required in VENDOR_SPECIFIC_FIELDS[storage_vendor]:
             value = get_copyoffload_credential(config_key, copyoffload_cfg)
             if value:
                 secret_data[secret_key] = value
                 LOGGER.info(f"✓ Added vendor-specific field: {secret_key}")
             elif required:
-                env_var_name = f"COPYOFFLOAD_{config_key.upper()}"
                 raise ValueError(
                     f"Required vendor-specific field '{config_key}' not found for vendor '{storage_vendor}'. "
-                    f"Add it to {providers_path} copyoffload section or set environment variable: {env_var_name}"
+                    f"Add it to {providers_path} copyoffload section or set environment variable: "
+                    f"{copyoffload_env_var_name(config_key)}"
                 )
 
     LOGGER.info(f"Creating storage secret for copy-offload with vendor: {storage_vendor}")
@@ -286,25 +264,32 @@ def copyoffload_ssh_key(
             "esxi_host, esxi_user, and esxi_password are required in the 'copyoffload' section of provider config for SSH method."
         )
 
-    # Install the key
-    install_ssh_key_on_esxi(
-        host=esxi_host,
-        username=esxi_user,
-        password=esxi_password,
-        public_key=public_key,
-        datastore_name=datastore_name,
-    )
+    # One connection serves both the install and the teardown removal
+    esxi_client = connect_to_esxi(host=esxi_host, username=esxi_user, password=esxi_password, keepalive=30)
+    try:
+        # Install the key
+        install_ssh_key_on_esxi(
+            host=esxi_host,
+            username=esxi_user,
+            password=esxi_password,
+            public_key=public_key,
+            datastore_name=datastore_name,
+            client=esxi_client,
+        )
 
-    yield
+        yield
 
-    # Teardown: Remove the key
-    LOGGER.info("Tearing down SSH key for copy-offload.")
-    remove_ssh_key_from_esxi(
-        host=esxi_host,
-        username=esxi_user,
-        password=esxi_password,
-        public_key=public_key,
-    )
+        # Teardown: Remove the key, reconnecting if the host dropped the connection during the session
+        LOGGER.info("Tearing down SSH key for copy-offload.")
+        remove_ssh_key_from_esxi(
+            host=esxi_host,
+            username=esxi_user,
+            password=esxi_password,
+            public_key=public_key,
+            client=esxi_client if is_esxi_client_connected(client=esxi_client) else None,
+        )
+    finally:
+        esxi_client.close()
 
 
 @pytest.fixture(scope="class")
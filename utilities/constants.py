@@ -1 +1,8 @@
+import json
+
 MTV_OPERATOR_NAME: str = "mtv-operator"
+# Server-side pre-filter for the forklift pods, not guaranteed to be set on every forklift pod
+FORKLIFT_PODS_LABEL_SELECTOR: str = "app=forklift"
+
+MULTUS_BRIDGE_NAME: str = "cnv-bridge"
+MULTUS_CNI_CONFIG: str = json.dumps({"cniVersion": "0.3.1", "type": MULTUS_BRIDGE_NAME, "bridge": MULTUS_BRIDGE_NAME})
@@ -4,6 +4,8 @@ Copy-offload utility constants.
 This module contains constants used for copy-offload functionality validation.
 """
 
+from types import MappingProxyType
+
 # Supported storage vendors for copy-offload functionality
 # Immutable tuple to prevent accidental modification
 SUPPORTED_VENDORS = (
@@ -17,3 +19,30 @@ SUPPORTED_VENDORS = (
     "infinibox",
     "flashsystem",
 )
+
+# Vendor-specific configuration mapping
+# Maps vendor name to (config_key, secret_key, required) tuples
+# Based on forklift vsphere-xcopy-volume-populator code and README
+VENDOR_SPECIFIC_FIELDS: MappingProxyType[str, tuple[tuple[str, str, bool], ...]] = MappingProxyType({
+    "ontap": (("ontap_svm", "ONTAP_SVM", True),),
+    "vantara": (
+        ("vantara_storage_id", "STORAGE_ID", True),
+        ("vantara_storage_port", "STORAGE_PORT", True),
+        ("vantara_hostgroup_id_list", "HOSTGROUP_ID_LIST", True),
+    ),
+    "primera3par": (),  # Only basic credentials required
+    "pureFlashArray": (("pure_cluster_prefix", "PURE_CLUSTER_PREFIX", True),),
+    "powerflex": (("powerflex_system_id", "POWERFLEX_SYSTEM_ID", True),),
+    "powermax": (("powermax_symmetrix_id", "POWERMAX_SYMMETRIX_ID", True),),
+    "powerstore": (),  # Only basic credentials required
+    "infinibox": (),  # Only basic credentials required
+    "flashsystem": (),  # Only basic credentials required
+})
+
+# Ensure VENDOR_SPECIFIC_FIELDS keys match SUPPORTED_VENDORS to prevent drift, checked once at import
+if set(VENDOR_SPECIFIC_FIELDS) != set(SUPPORTED_VENDORS):
+    raise ValueError(
+        "VENDOR_SPECIFIC_FIELDS keys must match SUPPORTED_VENDORS. "
+        f"Missing: {set(SUPPORTED_VENDORS) - set(VENDOR_SPECIFIC_FIELDS)}. "
+        f"Extra: {set(VENDOR_SPECIFIC_FIELDS) - set(SUPPORTED_VENDORS)}"
+    )
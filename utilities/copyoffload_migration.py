@@ -7,6 +7,7 @@ including credential management, cloud-init readiness checks, and XCOPY validati
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 from typing import TYPE_CHECKING, Any
@@ -27,6 +28,20 @@ if TYPE_CHECKING:
 LOGGER = get_logger(__name__)
 
 
+@functools.cache
+def copyoffload_env_var_name(credential_name: str) -> str:
+    """
+    Get the environment variable name that overrides a copyoffload credential.
+
+    Args:
+        credential_name: Name of the credential (e.g., "storage_hostname")
+
+    Returns:
+        str: The environment variable name, e.g. "COPYOFFLOAD_STORAGE_HOSTNAME"
+    """
+    return f"COPYOFFLOAD_{credential_name.upper()}"
+
+
 def get_copyoffload_credential(
     credential_name: str,
     copyoffload_config: dict[str, Any],
@@ -50,8 +65,7 @@ def get_copyoffload_credential(
         - "ontap_svm" → "COPYOFFLOAD_ONTAP_SVM"
         - "vantara_hostgroup_id_list" → "COPYOFFLOAD_VANTARA_HOSTGROUP_ID_LIST"
     """
-    env_var_name = f"COPYOFFLOAD_{credential_name.upper()}"
-    return os.getenv(env_var_name) or copyoffload_config.get(credential_name)
+    return os.getenv(copyoffload_env_var_name(credential_name)) or copyoffload_config.get(credential_name)
 
 
 def wait_for_plan_secret(ocp_admin_client: DynamicClient, namespace: str, plan_name: str) -> None:
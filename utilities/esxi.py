@@ -1,4 +1,7 @@
 import os
+from collections.abc import Generator
+from contextlib import contextmanager
+
 import paramiko
 from simple_logger.logger import get_logger
 
@@ -9,7 +12,71 @@ class ESXiError(Exception):
     """Exception raised for ESXi-related errors."""
 
 
-def install_ssh_key_on_esxi(host: str, username: str, password: str, public_key: str, datastore_name: str) -> None:
+def connect_to_esxi(host: str, username: str, password: str, keepalive: int = 0) -> paramiko.SSHClient:
+    """
+    Opens an SSH connection to an ESXi host.
+
+    Args:
+        host (str): The hostname or IP address of the ESXi host.
+        username (str): The username for SSH login (usually 'root').
+        password (str): The password for the user.
+        keepalive (int): Seconds between keepalive packets, 0 disables them. Set it for connections held open
+            for a long time.
+
+    Returns:
+        paramiko.SSHClient: The connected client, the caller is responsible for closing it.
+    """
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    LOGGER.info(f"Connecting to ESXi host {host}...")
+    client.connect(hostname=host, username=username, password=password)
+
+    transport = client.get_transport()
+    if keepalive and transport:
+        transport.set_keepalive(keepalive)
+
+    return client
+
+
+def is_esxi_client_connected(client: paramiko.SSHClient) -> bool:
+    """
+    Checks whether an SSH client's connection is still usable.
+
+    Args:
+        client (paramiko.SSHClient): The client to check.
+
+    Returns:
+        bool: True if the underlying transport is active.
+    """
+    transport = client.get_transport()
+    return bool(transport and transport.is_active())
+
+
+@contextmanager
+def _esxi_ssh_client(
+    host: str, username: str, password: str, client: paramiko.SSHClient | None
+) -> Generator[paramiko.SSHClient, None, None]:
+    # Reuse the caller's connection if given, otherwise open (and close) one for this operation
+    if client:
+        yield client
+        return
+
+    client = connect_to_esxi(host=host, username=username, password=password)
+    try:
+        yield client
+    finally:
+        client.close()
+        LOGGER.info("SSH connection to ESXi host closed.")
+
+
+def install_ssh_key_on_esxi(
+    host: str,
+    username: str,
+    password: str,
+    public_key: str,
+    datastore_name: str,
+    client: paramiko.SSHClient | None = None,
+) -> None:
     """
     Installs an SSH public key on an ESXi host with command restrictions.
     This method uses SFTP to write a temporary file and then moves it into place,
@@ -21,6 +88,8 @@ def install_ssh_key_on_esxi(host: str, username: str, password: str, public_key:
         password (str): The password for the user.
         public_key (str): The SSH public key string.
         datastore_name (str): The name of the datastore for the command restriction.
+        client (paramiko.SSHClient | None): Connected client to reuse, it is left open. If not given, a connection
+            is opened and closed for this call.
     """
     command_template = (
         'command="python /vmfs/volumes/{datastore_name}/secure-vmkfstools-wrapper.py",'
@@ -28,21 +97,16 @@ def install_ssh_key_on_esxi(host: str, username: str, password: str, public_key:
     )
     restricted_key = command_template.format(datastore_name=datastore_name, public_key=public_key)
 
-    client = None
-    sftp = None
-    try:
-        client = paramiko.SSHClient()
-        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        LOGGER.info(f"Connecting to ESXi host {host}...")
-        client.connect(hostname=host, username=username, password=password)
-        sftp = client.open_sftp()
-
+    with (
+        _esxi_ssh_client(host=host, username=username, password=password, client=client) as ssh_client,
+        ssh_client.open_sftp() as sftp,
+    ):
         authorized_keys_path = "/etc/ssh/keys-root/authorized_keys"
         temp_authorized_keys_path = f"/tmp/authorized_keys_{os.urandom(8).hex()}"
         key_dir = "/etc/ssh/keys-root"
 
         # Ensure the target directory exists
-        stdin, stdout, stderr = client.exec_command(f"mkdir -p {key_dir}")
+        stdin, stdout, stderr = ssh_client.exec_command(f"mkdir -p {key_dir}")
         exit_status = stdout.channel.recv_exit_status()
         if exit_status != 0:
             error = stderr.read().decode("utf-8")
@@ -72,7 +136,7 @@ def install_ssh_key_on_esxi(host: str, username: str, password: str, public_key:
         # Move temporary file to final destination and set permissions
         command = f"mv {temp_authorized_keys_path} {authorized_keys_path} && chmod 600 {authorized_keys_path}"
         LOGGER.info(f"Moving temporary file to '{authorized_keys_path}' and setting permissions.")
-        stdin, stdout, stderr = client.exec_command(command)
+        stdin, stdout, stderr = ssh_client.exec_command(command)
         exit_status = stdout.channel.recv_exit_status()
 
         if exit_status == 0:
@@ -86,15 +150,14 @@ def install_ssh_key_on_esxi(host: str, username: str, password: str, public_key:
                 LOGGER.warning(f"Failed to remove temporary file {temp_authorized_keys_path}: {e}")
             raise ESXiError(f"Failed to move key file and set permissions. Exit status: {exit_status}. Error: {error}")
 
-    finally:
-        if sftp:
-            sftp.close()
-        if client:
-            client.close()
-            LOGGER.info("SSH connection to ESXi host closed.")
-
 
-def remove_ssh_key_from_esxi(host: str, username: str, password: str, public_key: str) -> None:
+def remove_ssh_key_from_esxi(
+    host: str,
+    username: str,
+    password: str,
+    public_key: str,
+    client: paramiko.SSHClient | None = None,
+) -> None:
     """
     Removes an SSH public key from an ESXi host's authorized_keys file.
     This method uses a temporary file to safely rewrite the authorized_keys file.
@@ -104,16 +167,13 @@ def remove_ssh_key_from_esxi(host: str, username: str, password: str, public_key
         username (str): The username for SSH login (usually 'root').
         password (str): The password for the user.
         public_key (str): The SSH public key string to remove.
+        client (paramiko.SSHClient | None): Connected client to reuse, it is left open. If not given, a connection
+            is opened and closed for this call.
     """
-    client = None
-    sftp = None
-    try:
-        client = paramiko.SSHClient()
-        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        LOGGER.info(f"Connecting to ESXi host {host} for key removal...")
-        client.connect(hostname=host, username=username, password=password)
-        sftp = client.open_sftp()
-
+    with (
+        _esxi_ssh_client(host=host, username=username, password=password, client=client) as ssh_client,
+        ssh_client.open_sftp() as sftp,
+    ):
         authorized_keys_path = "/etc/ssh/keys-root/authorized_keys"
         temp_authorized_keys_path = f"/tmp/authorized_keys_{os.urandom(8).hex()}"
 
@@ -140,7 +200,7 @@ def remove_ssh_key_from_esxi(host: str, username: str, password: str, public_key
         # Atomically replace the old file with the new one
         command = f"mv {temp_authorized_keys_path} {authorized_keys_path}"
         LOGGER.info(f"Removing public key by replacing {authorized_keys_path} with temporary file.")
-        stdin, stdout, stderr = client.exec_command(command)
+        stdin, stdout, stderr = ssh_client.exec_command(command)
         exit_status = stdout.channel.recv_exit_status()
 
         if exit_status != 0:
@@ -153,9 +213,3 @@ def remove_ssh_key_from_esxi(host: str, username: str, password: str, public_key
             raise ESXiError(f"Failed to replace authorized_keys file. Exit status: {exit_status}. Error: {error}")
 
         LOGGER.info("SSH key removed successfully.")
-    finally:
-        if sftp:
-            sftp.close()
-        if client:
-            client.close()
-            LOGGER.info("SSH connection to ESXi host closed.")
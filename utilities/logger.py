@@ -1,3 +1,4 @@
+import functools
 import logging
 import multiprocessing
 import shutil
@@ -81,8 +82,14 @@ def setup_logging(log_level: int, log_file: str = "/tmp/pytest-tests.log") -> Qu
     return log_listener
 
 
+@functools.cache
+def _terminal_width() -> int:
+    # Queried once per process, separators are logged several times per test
+    return shutil.get_terminal_size(fallback=(120, 40))[0]
+
+
 def separator(symbol_: str, val: Optional[str] = None) -> str:
-    terminal_width = shutil.get_terminal_size(fallback=(120, 40))[0]
+    terminal_width = _terminal_width()
     if not val:
         return f"{symbol_ * terminal_width}"
 
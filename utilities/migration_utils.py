@@ -1,7 +1,6 @@
 import contextlib
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Any
 
 import pytz
 from kubernetes.dynamic import DynamicClient
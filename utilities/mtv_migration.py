@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from ocp_resources.migration import Migration
 from ocp_resources.network_map import NetworkMap
 from ocp_resources.plan import Plan
+from ocp_resources.provider import Provider
 from ocp_resources.storage_map import StorageMap
 from pytest_testconfig import py_config
 from simple_logger.logger import get_logger
@@ -24,12 +27,21 @@ from libs.providers.openshift import OCPProvider
 from utilities.copyoffload_migration import wait_for_plan_secret
 from utilities.resources import create_and_store_resource
 from utilities.utils import gen_network_map_list
+from utilities.vmware_guest_operations import detect_vmware_ip_origins_via_guest_ops
 
 if TYPE_CHECKING:
     from kubernetes.dynamic import DynamicClient
 
 LOGGER = get_logger(__name__)
 
+# Source providers whose clients can be shared between threads (pyVmomi stub, kubernetes DynamicClient).
+# The oVirt SDK connection is documented as not thread-safe and the openstacksdk Connection makes no such
+# guarantee, their VMs are prepared sequentially.
+CONCURRENT_VM_PREPARATION_PROVIDER_TYPES: tuple[str, ...] = (
+    Provider.ProviderType.VSPHERE,
+    Provider.ProviderType.OPENSHIFT,
+)
+
 
 def _find_migration_for_plan(plan: Plan) -> Migration:
     """Find Migration CR for Plan.
@@ -296,6 +308,8 @@ def execute_migration(
     wait_for_migration_complate(plan=plan)
 
 
+# Built from session-wide config only, so it is the same for every plan of the session
+@functools.cache
 def get_vm_suffix(warm_migration: bool) -> str:
     migration_type = "warm" if warm_migration else "cold"
     storage_class = py_config.get("storage_class", "")
@@ -310,6 +324,172 @@ def get_vm_suffix(warm_migration: bool) -> str:
     return vm_suffix
 
 
+def prepare_source_vm(
+    vm: dict[str, Any],
+    source_provider: Any,
+    source_provider_inventory: ForkliftInventory,
+    fixture_store: dict[str, Any],
+    source_vms_namespace: str,
+    vm_name_suffix: str,
+    warm_migration: bool,
+    preserve_static_ips: bool = False,
+) -> dict[str, Any]:
+    """Clone a source VM, set its power state and wait for it in the Forklift inventory.
+
+    Only the given `vm` entry is updated (name and snapshots), so VMs of the same plan can be prepared
+    concurrently.
+
+    Args:
+        vm (dict[str, Any]): The plan's VM entry, updated in-place with the cloned VM name and snapshots.
+        source_provider (Any): Source provider instance (VMWareProvider, OvirtProvider, etc.).
+        source_provider_inventory (ForkliftInventory): Source provider inventory.
+        fixture_store (dict[str, Any]): Fixture store for resource tracking.
+        source_vms_namespace (str): Source VMs namespace.
+        vm_name_suffix (str): Suffix added to the cloned VM name.
+        warm_migration (bool): Whether the plan is a warm migration, enables CTK on the clone.
+        preserve_static_ips (bool): Whether IP origin detection failures must fail the preparation.
+
+    Returns:
+        dict[str, Any]: The source VM details from `vm_dict()`.
+
+    Raises:
+        ValueError: If IP origin detection fails and `preserve_static_ips` is set.
+    """
+    vsphere_source = source_provider.type == Provider.ProviderType.VSPHERE
+
+    # Get VM object first (without full vm_dict analysis)
+    # Add enable_ctk flag for warm migrations
+    clone_options = {**vm, "enable_ctk": warm_migration}
+    provider_vm_api = source_provider.get_vm_by_name(
+        query=vm["name"],
+        vm_name_suffix=vm_name_suffix,
+        clone_vm=True,
+        session_uuid=fixture_store["session_uuid"],
+        clone_options=clone_options,
+    )
+
+    # Power state control: "on" = start VM, "off" = stop VM, not set = leave unchanged
+    source_vm_power = vm.get("source_vm_power")  # Optional - if not set, VM power state unchanged
+    if source_vm_power == "on":
+        source_provider.start_vm(provider_vm_api)
+        # Wait for guest info to become available (VMware only)
+        if vsphere_source:
+            source_provider.wait_for_vmware_guest_info(provider_vm_api, timeout=120)
+    elif source_vm_power == "off":
+        source_provider.stop_vm(provider_vm_api)
+
+    # NOW call vm_dict() with VM in correct power state for guest info
+    source_vm_details = source_provider.vm_dict(
+        provider_vm_api=provider_vm_api,
+        name=vm["name"],
+        namespace=source_vms_namespace,
+        clone=False,  # Already cloned above
+        vm_name_suffix=vm_name_suffix,
+        session_uuid=fixture_store["session_uuid"],
+        clone_options=vm,
+    )
+    vm["name"] = source_vm_details["name"]
+
+    # Wait for cloned VM to appear in Forklift inventory before proceeding
+    # This is needed for external providers that Forklift needs to sync from
+    # OVA never gets here, it doesn't clone VMs (uses pre-existing files)
+    if source_provider.type == Provider.ProviderType.OPENSHIFT:
+        # Created on the cluster Forklift watches, it shows up within seconds, poll often with a short safety net
+        source_provider_inventory.wait_for_vm(name=vm["name"], timeout=60, sleep=2)
+    else:
+        source_provider_inventory.wait_for_vm(name=vm["name"], timeout=300)
+
+    provider_vm_api = source_vm_details["provider_vm_api"]
+
+    vm["snapshots_before_migration"] = source_vm_details["snapshots_data"]
+
+    # Detect IP origins via Guest Operations for Linux VMs where VMware doesn't report origin
+    # (known open-vm-tools limitation: https://github.com/vmware/open-vm-tools/issues/694)
+    if vsphere_source and not source_vm_details.get("win_os"):
+        try:
+            detect_vmware_ip_origins_via_guest_ops(
+                source_provider=source_provider,
+                vm=provider_vm_api,
+                source_provider_data=fixture_store["source_provider_data"],
+                vm_details=source_vm_details,
+            )
+        except ValueError:
+            raise
+        except Exception as e:
+            if preserve_static_ips:
+                raise ValueError(
+                    f"Failed to detect IP origins via Guest Operations for VM {vm['name']}: {e}. "
+                    "IP origin detection is required when preserve_static_ips is enabled."
+                ) from e
+            LOGGER.warning(
+                f"Failed to detect IP origins via Guest Operations for VM {vm['name']}: {e}. "
+                "Static IP verification may not work for this VM."
+            )
+
+    return source_vm_details
+
+
+def prepare_source_vms(
+    virtual_machines: list[dict[str, Any]],
+    source_provider: Any,
+    source_provider_inventory: ForkliftInventory,
+    fixture_store: dict[str, Any],
+    source_vms_namespace: str,
+    vm_name_suffix: str,
+    warm_migration: bool,
+    preserve_static_ips: bool = False,
+) -> list[dict[str, Any]]:
+    """Prepare all source VMs of a plan with `prepare_source_vm`, concurrently where it is safe.
+
+    VM entries with the same name resolve to the same clone (e.g. copy-offload `default_vm_name`), so they are
+    prepared one after another in the same thread: the first one clones the VM and the others reuse it, as a
+    sequential loop would. Different names are prepared concurrently for providers listed in
+    `CONCURRENT_VM_PREPARATION_PROVIDER_TYPES`, other providers prepare all VMs sequentially.
+
+    Args:
+        virtual_machines (list[dict[str, Any]]): The plan's VM entries, each updated in-place.
+        source_provider (Any): Source provider instance (VMWareProvider, OvirtProvider, etc.).
+        source_provider_inventory (ForkliftInventory): Source provider inventory.
+        fixture_store (dict[str, Any]): Fixture store for resource tracking.
+        source_vms_namespace (str): Source VMs namespace.
+        vm_name_suffix (str): Suffix added to the cloned VM names.
+        warm_migration (bool): Whether the plan is a warm migration, enables CTK on the clones.
+        preserve_static_ips (bool): Whether IP origin detection failures must fail the preparation.
+
+    Returns:
+        list[dict[str, Any]]: The source VM details, in the order of `virtual_machines`.
+    """
+    _prepare_source_vm = functools.partial(
+        prepare_source_vm,
+        source_provider=source_provider,
+        source_provider_inventory=source_provider_inventory,
+        fixture_store=fixture_store,
+        source_vms_namespace=source_vms_namespace,
+        vm_name_suffix=vm_name_suffix,
+        warm_migration=warm_migration,
+        preserve_static_ips=preserve_static_ips,
+    )
+
+    # Group by the name the VM is cloned from, before prepare_source_vm renames the entries
+    vms_by_name: dict[str, list[int]] = {}
+    for index, vm in enumerate(virtual_machines):
+        vms_by_name.setdefault(vm["name"], []).append(index)
+
+    def _prepare_same_name_vms(indexes: list[int]) -> list[dict[str, Any]]:
+        return [_prepare_source_vm(virtual_machines[index]) for index in indexes]
+
+    max_workers = min(len(vms_by_name), 10) if source_provider.type in CONCURRENT_VM_PREPARATION_PROVIDER_TYPES else 1
+    with ThreadPoolExecutor(max_workers=max_workers or 1) as executor:
+        groups_details = list(executor.map(_prepare_same_name_vms, vms_by_name.values()))
+
+    source_vms_details: list[dict[str, Any]] = [{} for _ in virtual_machines]
+    for indexes, group_details in zip(vms_by_name.values(), groups_details):
+        for index, source_vm_details in zip(indexes, group_details):
+            source_vms_details[index] = source_vm_details
+
+    return source_vms_details
+
+
 def get_plan_migration_status(plan: Plan) -> str:
     """Get the migration status from the Plan conditions.
 
@@ -487,12 +667,10 @@ def get_storage_migration_map(
             LOGGER.info(f"Added non-XCOPY datastore mapping for: {non_xcopy_datastore_id} (with xcopy fallback)")
     else:
         LOGGER.info(f"Creating standard storage map for VMs: {vms}")
-        storage_migration_map = source_provider_inventory.vms_storages_mappings(vms=vms)
-        for storage in storage_migration_map:
-            storage_map_list.append({
-                "destination": {"storageClass": target_storage_class},
-                "source": storage,
-            })
+        storage_map_list = [
+            {"destination": {"storageClass": target_storage_class}, "source": storage}
+            for storage in source_provider_inventory.vms_storages_mappings(vms=vms)
+        ]
 
     storage_map = create_and_store_resource(
         fixture_store=fixture_store,
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import shlex
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -170,15 +169,26 @@ def run_must_gather(data_collector_path: Path, plan: dict[str, str] | None = Non
             mtv_csv=mtv_csv,
         )
 
-        _must_gather_base_cmd = f"oc adm must-gather --image={must_gather_image} --dest-dir={data_collector_path}"
+        # argv is built directly, a dest dir with spaces stays a single argument
+        _must_gather_base_cmd = [
+            "oc",
+            "adm",
+            "must-gather",
+            f"--image={must_gather_image}",
+            f"--dest-dir={data_collector_path}",
+        ]
 
         if plan:
             plan_name = plan["name"]
             plan_namespace = plan["namespace"]
-            run_command(
-                shlex.split(f"{_must_gather_base_cmd} -- NS={plan_namespace} PLAN={plan_name} /usr/bin/targeted")
-            )
+            run_command([
+                *_must_gather_base_cmd,
+                "--",
+                f"NS={plan_namespace}",
+                f"PLAN={plan_name}",
+                "/usr/bin/targeted",
+            ])
         else:
-            run_command(shlex.split(f"{_must_gather_base_cmd} -- -- NS={mtv_namespace}"))
+            run_command([*_must_gather_base_cmd, "--", "--", f"NS={mtv_namespace}"])
     except Exception as ex:
         LOGGER.exception(f"Failed to run must-gather. {ex}")
@@ -3,7 +3,9 @@ from __future__ import annotations
 import contextlib
 import json
 import os
+import pickle
 import shutil
+import tempfile
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -18,6 +20,7 @@ from ocp_resources.network_map import NetworkMap
 from ocp_resources.plan import Plan
 from ocp_resources.pod import Pod
 from ocp_resources.provider import Provider
+from ocp_resources.resource import NamespacedResource
 from ocp_resources.secret import Secret
 from ocp_resources.storage_map import StorageMap
 from ocp_resources.virtual_machine import VirtualMachine
@@ -36,6 +39,8 @@ if TYPE_CHECKING:
 
 LOGGER = get_logger(__name__)
 
+XDIST_RESULTS_SUFFIX = ".xdist"
+
 
 def is_dry_run(config: pytest.Config) -> bool:
     """Check if pytest was invoked in dry-run mode (collectonly or setupplan).
@@ -58,6 +63,196 @@ def prepare_base_path(base_path: Path) -> None:
     base_path.mkdir(parents=True, exist_ok=True)
 
 
+def fast_rmtree(path: Path | str, max_workers: int = 8) -> None:
+    """Remove a directory tree, removing its top-level subdirectories in parallel.
+
+    Errors are ignored, same as `shutil.rmtree(path, ignore_errors=True)`.
+
+    Args:
+        path (Path | str): Directory to remove.
+        max_workers (int): Maximum number of subdirectories removed concurrently.
+
+    Raises:
+        ValueError: If `path` is empty, os.scandir would otherwise scan the current directory.
+    """
+    if not path:
+        raise ValueError("fast_rmtree requires a path, refusing to remove the current directory")
+
+    try:
+        with os.scandir(path) as entries:
+            sub_dirs: list[str] = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    sub_dirs.append(entry.path)
+                else:
+                    with contextlib.suppress(OSError):
+                        os.unlink(entry.path)
+    except OSError:
+        return
+
+    if sub_dirs:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sub_dirs))) as executor:
+            for sub_dir in sub_dirs:
+                executor.submit(shutil.rmtree, sub_dir, ignore_errors=True)
+
+    with contextlib.suppress(OSError):
+        os.rmdir(path)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory's entries (creations, renames) to disk.
+
+    Args:
+        path (Path): Directory to flush.
+    """
+    dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def reset_xdist_results_dir(results_path: Path) -> None:
+    """Replace the xdist results directory with a new empty one.
+
+    The new directory is created under a temporary name and renamed into place, and the parent directory is
+    fsynced, so workers never see a half removed directory. The previous directory is moved aside before removal.
+
+    Args:
+        results_path (Path): Directory shared by the xdist controller and workers.
+    """
+    parent_path = results_path.parent
+    staging_path = Path(tempfile.mkdtemp(dir=parent_path, prefix=f".{results_path.name}_"))
+    stale_path: Path | None = None
+
+    if results_path.exists():
+        # renaming a directory over an empty one is allowed, so a unique empty directory reserves the name
+        stale_path = Path(tempfile.mkdtemp(dir=parent_path, prefix=f".{results_path.name}_stale_"))
+        os.replace(results_path, stale_path)
+
+    os.replace(staging_path, results_path)
+    _fsync_dir(path=parent_path)
+    if stale_path:
+        fast_rmtree(path=stale_path)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to a temporary file next to `path` and rename it into place.
+
+    The temporary file is fsynced before the rename so readers never observe a partially written file.
+
+    Args:
+        path (Path): Final file path.
+        data (bytes): File content.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as fd:
+        fd.write(data)
+        fd.flush()
+        os.fsync(fd.fileno())
+
+    os.replace(tmp_path, path)
+
+
+def _picklable_fixture_store(worker_id: str, fixture_store: dict[str, Any]) -> dict[str, Any]:
+    """Return the fixture store without the entries that cannot be pickled.
+
+    Args:
+        worker_id (str): The xdist worker id, used for logging.
+        fixture_store (dict[str, Any]): The worker's fixture store.
+
+    Returns:
+        dict[str, Any]: The picklable fixture store entries.
+    """
+    picklable_fixture_store: dict[str, Any] = {}
+
+    for key, value in fixture_store.items():
+        try:
+            pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as exp:
+            LOGGER.warning(
+                f"Skipping worker {worker_id}'s unpicklable fixture store entry {key}: [{exp.__class__}] {exp}"
+            )
+            continue
+
+        picklable_fixture_store[key] = value
+
+    return picklable_fixture_store
+
+
+def dump_xdist_worker_results(
+    results_path: Path, worker_id: str, session_items: list[Any], fixture_store: dict[str, Any]
+) -> None:
+    """Persist a worker's harvested session items and fixture store.
+
+    Both are pickled together into a single `<worker_id>.xdist` file. If pickling fails, the fixture store entries
+    that cannot be pickled are skipped, so one bad entry does not lose the worker's whole harvest.
+
+    Args:
+        results_path (Path): Directory shared by the xdist controller and workers.
+        worker_id (str): The xdist worker id.
+        session_items (list[Any]): Persistable session items collected by pytest-harvest.
+        fixture_store (dict[str, Any]): The worker's fixture store.
+    """
+    try:
+        data = pickle.dumps((session_items, fixture_store), protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as exp:
+        LOGGER.warning(f"Error while pickling worker {worker_id}'s harvested results: [{exp.__class__}] {exp}")
+        try:
+            data = pickle.dumps(
+                (session_items, _picklable_fixture_store(worker_id=worker_id, fixture_store=fixture_store)),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except Exception as exp:
+            LOGGER.warning(f"Worker {worker_id}'s harvested results are not persisted: [{exp.__class__}] {exp}")
+            return
+
+    _atomic_write_bytes(path=results_path / f"{worker_id}{XDIST_RESULTS_SUFFIX}", data=data)
+
+
+def _load_xdist_worker_result(results_file: str) -> tuple[list[Any], dict[str, Any]]:
+    """Load the session items and fixture store persisted for a single worker.
+
+    The file is unlinked once read, so the results directory is empty by cleanup time.
+
+    Args:
+        results_file (str): Path to the worker's results file.
+
+    Returns:
+        tuple[list[Any], dict[str, Any]]: The worker's session items and fixture store.
+    """
+    with open(results_file, "rb") as fd:
+        session_items, fixture_store = pickle.load(fd)
+
+    with contextlib.suppress(OSError):
+        os.unlink(results_file)
+
+    return session_items, fixture_store
+
+
+def load_xdist_worker_results(results_path: Path) -> dict[str, tuple[list[Any], dict[str, Any]]]:
+    """Load the results persisted by `dump_xdist_worker_results` for all workers.
+
+    Args:
+        results_path (Path): Directory shared by the xdist controller and workers.
+
+    Returns:
+        dict[str, tuple[list[Any], dict[str, Any]]]: Worker id to (session items, fixture store).
+    """
+    # scandir entries carry the file type, no extra stat or Path object per file
+    with os.scandir(results_path) as entries:
+        results_files = {
+            entry.name.removesuffix(XDIST_RESULTS_SUFFIX): entry.path
+            for entry in entries
+            if entry.name.endswith(XDIST_RESULTS_SUFFIX) and entry.is_file(follow_symlinks=False)
+        }
+
+    return {
+        worker_id: _load_xdist_worker_result(results_file=results_file)
+        for worker_id, results_file in results_files.items()
+    }
+
+
 def setup_ai_analysis(session: pytest.Session) -> None:
     """Configure AI analysis for test failure reporting.
 
@@ -128,6 +323,57 @@ def session_teardown(session_store: dict[str, Any]) -> None:
             raise SessionTeardownError(f"Failed to clean up the following resources: {leftovers}")
 
 
+def _clean_up_resources(
+    resource_class: type[NamespacedResource],
+    resources: list[dict[str, str]],
+    ocp_client: DynamicClient,
+    leftovers: dict[str, list[dict[str, str]]],
+    only_existing: bool = False,
+) -> dict[str, list[dict[str, str]]]:
+    """Delete resources of a single kind concurrently and record the ones that were not deleted.
+
+    Resources of the same kind do not depend on each other, so their delete-and-wait calls run together.
+    The order between kinds is kept by the caller.
+
+    Args:
+        resource_class (type[NamespacedResource]): Resource class of all the given resources.
+        resources (list[dict[str, str]]): Resources to delete, each with ``name`` and ``namespace`` keys.
+        ocp_client (DynamicClient): OpenShift client.
+        leftovers (dict[str, list[dict[str, str]]]): Leftovers collected so far, updated in place.
+        only_existing (bool): Skip resources that no longer exist instead of deleting them.
+
+    Returns:
+        dict[str, list[dict[str, str]]]: The updated leftovers.
+    """
+
+    def _clean_up(resource: dict[str, str]) -> NamespacedResource | dict[str, str] | None:
+        # Returns the leftover to record, None when the resource is gone
+        try:
+            resource_obj = resource_class(name=resource["name"], namespace=resource["namespace"], client=ocp_client)
+            if only_existing and not resource_obj.exists:
+                return None
+
+            return None if resource_obj.clean_up(wait=True) else resource_obj
+        except Exception as exc:
+            LOGGER.error(f"Failed to cleanup {resource_class.kind} {resource['name']}: {exc}")
+            return resource
+
+    if not resources:
+        return leftovers
+
+    with ThreadPoolExecutor(max_workers=min(len(resources), 10)) as executor:
+        results = list(executor.map(_clean_up, resources))
+
+    # leftovers is only updated from this thread
+    for leftover in results:
+        if isinstance(leftover, NamespacedResource):
+            leftovers = append_leftovers(leftovers=leftovers, resource=leftover)
+        elif leftover is not None:
+            leftovers.setdefault(resource_class.kind, []).append(leftover)
+
+    return leftovers
+
+
 def teardown_resources(
     session_store: dict[str, Any],
     ocp_client: DynamicClient,
@@ -161,107 +407,30 @@ def teardown_resources(
     pods = session_teardown_resources.get(Pod.kind, [])
     virtual_machines = session_teardown_resources.get(VirtualMachine.kind, [])
 
-    # Clean all resources that was created by the tests
-    for migration in migrations:
-        try:
-            migration_obj = Migration(name=migration["name"], namespace=migration["namespace"], client=ocp_client)
-            if not migration_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=migration_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup migration {migration['name']}: {exc}")
-            leftovers.setdefault(Migration.kind, []).append(migration)
-
-    for plan in plans:
-        try:
-            plan_obj = Plan(name=plan["name"], namespace=plan["namespace"], client=ocp_client)
-            if not plan_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=plan_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup plan {plan['name']}: {exc}")
-            leftovers.setdefault(Plan.kind, []).append(plan)
-
-    for provider in providers:
-        try:
-            provider_obj = Provider(name=provider["name"], namespace=provider["namespace"], client=ocp_client)
-            if not provider_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=provider_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup provider {provider['name']}: {exc}")
-            leftovers.setdefault(Provider.kind, []).append(provider)
-
-    for host in hosts:
-        try:
-            host_obj = Host(name=host["name"], namespace=host["namespace"], client=ocp_client)
-            if not host_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=host_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup host {host['name']}: {exc}")
-            leftovers.setdefault(Host.kind, []).append(host)
-
-    for secret in secrets:
-        try:
-            secret_obj = Secret(name=secret["name"], namespace=secret["namespace"], client=ocp_client)
-            if not secret_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=secret_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup secret {secret['name']}: {exc}")
-            leftovers.setdefault(Secret.kind, []).append(secret)
-
-    for network_attachment_definition in network_attachment_definitions:
-        try:
-            network_attachment_definition_obj = NetworkAttachmentDefinition(
-                name=network_attachment_definition["name"],
-                namespace=network_attachment_definition["namespace"],
-                client=ocp_client,
-            )
-            if not network_attachment_definition_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=network_attachment_definition_obj)
-        except Exception as exc:
-            LOGGER.error(
-                f"Failed to cleanup NetworkAttachmentDefinition {network_attachment_definition['name']}: {exc}"
-            )
-            leftovers.setdefault(NetworkAttachmentDefinition.kind, []).append(network_attachment_definition)
-
-    for storagemap in storagemaps:
-        try:
-            storagemap_obj = StorageMap(name=storagemap["name"], namespace=storagemap["namespace"], client=ocp_client)
-            if not storagemap_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=storagemap_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup StorageMap {storagemap['name']}: {exc}")
-            leftovers.setdefault(StorageMap.kind, []).append(storagemap)
-
-    for networkmap in networkmaps:
-        try:
-            networkmap_obj = NetworkMap(name=networkmap["name"], namespace=networkmap["namespace"], client=ocp_client)
-            if not networkmap_obj.clean_up(wait=True):
-                leftovers = append_leftovers(leftovers=leftovers, resource=networkmap_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup NetworkMap {networkmap['name']}: {exc}")
-            leftovers.setdefault(NetworkMap.kind, []).append(networkmap)
+    # Clean all resources that was created by the tests, kind by kind in dependency order
+    for resource_class, resources in (
+        (Migration, migrations),
+        (Plan, plans),
+        (Provider, providers),
+        (Host, hosts),
+        (Secret, secrets),
+        (NetworkAttachmentDefinition, network_attachment_definitions),
+        (StorageMap, storagemaps),
+        (NetworkMap, networkmaps),
+    ):
+        leftovers = _clean_up_resources(
+            resource_class=resource_class, resources=resources, ocp_client=ocp_client, leftovers=leftovers
+        )
 
     # Check that resources that was created by running migration are deleted
-    for virtual_machine in virtual_machines:
-        try:
-            virtual_machine_obj = VirtualMachine(
-                name=virtual_machine["name"], namespace=virtual_machine["namespace"], client=ocp_client
-            )
-            if virtual_machine_obj.exists:
-                if not virtual_machine_obj.clean_up(wait=True):
-                    leftovers = append_leftovers(leftovers=leftovers, resource=virtual_machine_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup VirtualMachine {virtual_machine['name']}: {exc}")
-            leftovers.setdefault(VirtualMachine.kind, []).append(virtual_machine)
-
-    for pod in pods:
-        try:
-            pod_obj = Pod(name=pod["name"], namespace=pod["namespace"], client=ocp_client)
-            if pod_obj.exists:
-                if not pod_obj.clean_up(wait=True):
-                    leftovers = append_leftovers(leftovers=leftovers, resource=pod_obj)
-        except Exception as exc:
-            LOGGER.error(f"Failed to cleanup Pod {pod['name']}: {exc}")
-            leftovers.setdefault(Pod.kind, []).append(pod)
+    for resource_class, resources in ((VirtualMachine, virtual_machines), (Pod, pods)):
+        leftovers = _clean_up_resources(
+            resource_class=resource_class,
+            resources=resources,
+            ocp_client=ocp_client,
+            leftovers=leftovers,
+            only_existing=True,
+        )
 
     if target_namespace:
         try:
@@ -1,12 +1,15 @@
+import time
 from typing import TYPE_CHECKING, Any
 
 import yaml
+from kubernetes.client.exceptions import ApiException
 from kubernetes.dynamic.exceptions import ConflictError
 from ocp_resources.migration import Migration
 from ocp_resources.namespace import Namespace
 from ocp_resources.plan import Plan
 from ocp_resources.resource import Resource
 from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError
 
 from utilities.naming import generate_name_with_uuid
 
@@ -110,3 +113,57 @@ def get_or_create_namespace(
         )
     ns.wait_for_status(status=ns.Status.ACTIVE)
     return namespace_name
+
+
+def wait_for_condition_watch(resource: Resource, condition: str, status: str, timeout: int = 300) -> None:
+    """Wait for a resource condition using a watch stream instead of polling.
+
+    The current state is checked first, then the resource is watched from its current resourceVersion.
+    The API server can end a watch early or expire its resourceVersion (410 Gone), the state is then read again
+    and the resource is watched for the remaining time.
+
+    Args:
+        resource (Resource): The resource to wait on.
+        condition (str): Condition type to wait for.
+        status (str): Expected condition status.
+        timeout (int): Time to wait in seconds.
+
+    Raises:
+        TimeoutExpiredError: If the condition is not reached within timeout.
+    """
+    LOGGER.info(f"Wait for {resource.kind}/{resource.name}'s '{condition}' condition to be '{status}'")
+
+    def _condition_met(resource_dict: dict[str, Any]) -> bool:
+        return any(
+            cond.get("type") == condition and cond.get("status") == status
+            for cond in (resource_dict.get("status") or {}).get("conditions") or []
+        )
+
+    deadline = time.monotonic() + timeout
+
+    while True:
+        resource_dict = resource.instance.to_dict()
+        if _condition_met(resource_dict=resource_dict):
+            return
+
+        if (remaining := int(deadline - time.monotonic())) <= 0:
+            break
+
+        try:
+            for event in resource.watcher(
+                timeout=remaining, resource_version=resource_dict["metadata"]["resourceVersion"]
+            ):
+                if event["type"] == "ERROR":
+                    # e.g. an expired resourceVersion, read the state again and watch from there
+                    break
+
+                if _condition_met(resource_dict=event["raw_object"]):
+                    return
+
+        except ApiException as exp:
+            if exp.status != 410:
+                raise
+
+            LOGGER.info(f"Watch on {resource.kind}/{resource.name} expired, watching again")
+
+    raise TimeoutExpiredError(f"{resource.kind}/{resource.name} condition '{condition}' did not become '{status}'")
@@ -5,10 +5,11 @@ import json
 import multiprocessing
 import os
 import re
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
 from contextlib import contextmanager, suppress
 from pathlib import Path
 from subprocess import STDOUT, check_output
+from types import MappingProxyType
 from typing import Any
 
 import pytest
@@ -72,16 +73,19 @@ def resolve_providers_json_path(cli_path: str | None = None) -> str:
     return resolved
 
 
-def load_source_providers(providers_json_path: str | None = None) -> dict[str, dict[str, Any]]:
+@functools.cache
+def load_source_providers(providers_json_path: str | None = None) -> Mapping[str, dict[str, Any]]:
     """Load source providers from providers JSON file.
 
     The file path is resolved and validated via ``resolve_providers_json_path()``.
+    The file is read once per process, collection and the ``source_providers`` fixture share the result,
+    which is returned read-only so no caller can change it for the others.
 
     Args:
         providers_json_path (str | None): Explicit path to the providers JSON file.
 
     Returns:
-        dict[str, dict[str, Any]]: Provider configurations keyed by provider name.
+        Mapping[str, dict[str, Any]]: Read-only provider configurations keyed by provider name.
 
     Raises:
         ProviderEmptyContentError: If the file is empty.
@@ -89,22 +93,25 @@ def load_source_providers(providers_json_path: str | None = None) -> dict[str, d
     """
     resolved_path = resolve_providers_json_path(cli_path=providers_json_path)
 
-    with open(resolved_path) as fd:
-        content = fd.read()
-        if not content.strip():
-            raise ProviderEmptyContentError(path=resolved_path)
-        providers = json.loads(content)
-        if not isinstance(providers, dict):
-            raise ValueError(
-                f"Providers JSON must be a mapping of provider names to configurations, "
-                f"got {type(providers).__name__}: '{resolved_path}'"
-            )
-        return providers
+    content = Path(resolved_path).read_bytes()
+    if not content.strip():
+        raise ProviderEmptyContentError(path=resolved_path)
+
+    providers = json.loads(content)
+    if not isinstance(providers, dict):
+        raise ValueError(
+            f"Providers JSON must be a mapping of provider names to configurations, "
+            f"got {type(providers).__name__}: '{resolved_path}'"
+        )
+    return MappingProxyType(providers)
 
 
+@functools.lru_cache(maxsize=4096)
 def generate_class_hash_prefix(nodeid: str, length: int = 6) -> str:
     """Generate a FIPS-compliant hash prefix for class-based resource naming.
 
+    Memoized, class-scoped fixtures of the same class hash the same node id.
+
     Args:
         nodeid (str): The pytest node ID (e.g., request.node.nodeid).
         length (int): Length of the hash prefix (default: 6).
@@ -435,6 +442,22 @@ def delete_all_vms(ocp_admin_client: DynamicClient, namespace: str) -> None:
             vm.clean_up(wait=True)
 
 
+def delete_vm_if_exists(ocp_admin_client: DynamicClient, vm_name: str, namespace: str) -> None:
+    """Delete a VM and wait for it to be gone, if it still exists.
+
+    Args:
+        ocp_admin_client (DynamicClient): OpenShift client.
+        vm_name (str): Name of the VM.
+        namespace (str): Namespace of the VM.
+    """
+    vm_obj = VirtualMachine(client=ocp_admin_client, name=vm_name, namespace=namespace)
+    if vm_obj.exists:
+        LOGGER.info(f"Cleaning up migrated VM: {vm_name} from namespace: {namespace}")
+        vm_obj.clean_up()
+    else:
+        LOGGER.info(f"VM {vm_name} already deleted from namespace: {namespace}, skipping cleanup")
+
+
 class VirtualMachineFromInstanceType(VirtualMachine):
     """Custom VirtualMachine class that simplifies VM creation with instancetype/preference
     and automatically builds the entire configuration from simple parameters.
@@ -601,6 +624,9 @@ class VirtualMachineFromInstanceType(VirtualMachine):
 def get_cluster_client() -> DynamicClient:
     """Get a DynamicClient for the cluster.
 
+    A new client is created on every call. Fixtures share the session-scoped `ocp_admin_client`, while
+    session teardown and must-gather threads log in again so they do not depend on the session-start token.
+
     Returns:
         DynamicClient: The cluster client.
 